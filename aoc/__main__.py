@@ -0,0 +1,5 @@
+import sys
+
+from aoc.cli import main
+
+sys.exit(main())
@@ -0,0 +1,86 @@
+"""Batch mode: solve one day against many input files on a process pool.
+
+``solve_many`` streams one result per input in completion order, so a huge
+corpus never has to be held in memory or finish before the first answers
+show up.  A failing input yields an ``ok: False`` record instead of
+stopping the batch.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from aoc.cache import ParseCache
+from aoc.days import load_module
+from aoc.runner import run_day
+
+
+def expand_paths(paths: Iterable[str]) -> List[str]:
+    """Expand directories to the sorted ``*.txt`` files they contain."""
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            expanded.extend(sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith('.txt')))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def _solve_one(day: int, path: str, parts: Sequence[int], cache: Optional[ParseCache], engine: str) -> Dict:
+    try:
+        result = run_day(day, path, cache, parts=parts, engine=engine)
+    except Exception as e:
+        return {'day': day, 'input': path, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+    result['ok'] = True
+    return result
+
+
+def solve_many(day: int, paths: Iterable[str], workers: Optional[int] = None, parts: Sequence[int] = (1, 2),
+               cache: Optional[ParseCache] = None, engine: str = 'default') -> Iterator[Dict]:
+    """Solve ``day`` for every path, yielding results as they finish."""
+    workers = workers or os.cpu_count() or 1
+    paths = iter(paths)
+    # Keep a few tasks queued per worker instead of submitting the whole corpus
+    window = workers * 4
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_module, initargs=(day,)) as executor:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < window:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                else:
+                    pending.add(executor.submit(_solve_one, day, path, parts, cache, engine))
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+class Throughput:
+    """Counts finished inputs against wall time."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.count = 0
+        self.failed = 0
+
+    def add(self, result: Dict) -> None:
+        self.count += 1
+        if not result['ok']:
+            self.failed += 1
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    @property
+    def rate(self) -> float:
+        return self.count / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        failed = f", {self.failed} failed" if self.failed else ""
+        return f"{self.count} inputs{failed} in {self.elapsed:.2f} s ({self.rate:.1f} inputs/s)"
@@ -0,0 +1,102 @@
+"""Benchmark harness: time every stage of a day across a size sweep.
+
+Inputs come from ``aoc.generators`` so a (day, size, seed) triple always
+benchmarks the same file.  Results are plain JSON so two runs can be diffed
+with ``compare`` to catch regressions.
+"""
+
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Dict, Iterable, List, Optional
+
+from aoc.cache import ParseCache
+from aoc.generators import DEFAULT_SIZES, generate
+from aoc.runner import run_day
+
+
+def bench_day(day: int, sizes: Optional[Iterable[int]] = None, seed: int = 0, repeat: int = 1,
+              cache: Optional[ParseCache] = None, fused: bool = True, engine: str = 'default') -> List[Dict]:
+    """Benchmark one day; each stage keeps its best time over ``repeat`` runs."""
+    records = []
+    with tempfile.TemporaryDirectory(prefix=f"aoc-bench-day{day:02d}-") as tmp:
+        for size in sizes or DEFAULT_SIZES[day]:
+            path = os.path.join(tmp, f"size{size}.txt")
+            with open(path, 'w') as f:
+                f.write(generate(day, size, seed))
+
+            timings = {}
+            for _ in range(repeat):
+                result = run_day(day, path, cache, fused=fused, engine=engine)
+                for stage, seconds in result['timings'].items():
+                    timings[stage] = min(seconds, timings.get(stage, seconds))
+
+            records.append({
+                'day': day,
+                'size': size,
+                'seed': seed,
+                'engine': result['engine'],
+                'bytes': os.path.getsize(path),
+                'timings': timings,
+                'answers': [str(answer) for answer in result['answers']],
+            })
+    return records
+
+
+def run_benchmarks(days: Iterable[int], sizes: Optional[Iterable[int]] = None,
+                   seed: int = 0, repeat: int = 1, cache: Optional[ParseCache] = None,
+                   fused: bool = True, engine: str = 'default') -> Dict:
+    """Benchmark several days and wrap the records with run metadata."""
+    records = []
+    for day in days:
+        records.extend(bench_day(day, sizes, seed, repeat, cache, fused, engine))
+
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cached_parse': cache is not None,
+        'results': records,
+    }
+
+
+def _record_key(record: Dict) -> tuple:
+    # Records from before engines were recorded all ran the default engine
+    return record['day'], record['size'], record['seed'], record.get('engine', 'default')
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 1.2) -> List[Dict]:
+    """List stages that got slower than ``threshold`` times the baseline run of the same engine."""
+    previous = {_record_key(r): r for r in baseline['results']}
+    regressions = []
+
+    for record in current['results']:
+        before = previous.get(_record_key(record))
+        if before is None:
+            continue
+        for stage, seconds in record['timings'].items():
+            old = before['timings'].get(stage)
+            if old and seconds / old > threshold:
+                regressions.append({
+                    'day': record['day'],
+                    'size': record['size'],
+                    'engine': record.get('engine', 'default'),
+                    'stage': stage,
+                    'before': old,
+                    'after': seconds,
+                    'ratio': seconds / old,
+                })
+    return regressions
+
+
+def save(report: Dict, path: str) -> None:
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def load(path: str) -> Dict:
+    with open(path, 'r') as f:
+        return json.load(f)
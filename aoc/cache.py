@@ -0,0 +1,199 @@
+"""Content-addressed on-disk cache of parsed inputs.
+
+Entries are keyed by the SHA-256 of the input bytes together with the SHA-256
+of the day's ``solution.py``, so editing either the input or the parser
+invalidates them.  Parsed structures are stored as ``.npz`` archives of plain
+arrays (loaded with ``allow_pickle=False``) through a per-day codec that
+flattens the structure on the way in and rebuilds it on the way out.  Days
+without a codec (line lists that rebuild no faster than they parse, day06's
+padded worksheet), or whose values do not fit the array types, are simply
+not cached.
+
+The cache directory defaults to ``~/.cache/aoc2025`` (``AOC_CACHE_DIR``) and
+is trimmed to ``AOC_CACHE_MAX_BYTES`` (default 256 MiB) by evicting the least
+recently used entries.
+"""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import zipfile
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import numpy as np
+
+from aoc.days import day_dir
+from aoc.inputs import map_input
+
+DEFAULT_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'aoc2025')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when a codec changes its array layout
+FORMAT_VERSION = 1
+
+
+class Codec(NamedTuple):
+    encode: Callable[[Any], Dict[str, np.ndarray]]
+    decode: Callable[[Dict[str, np.ndarray]], Any]
+
+
+def _int_rows(rows, width):
+    return np.array(rows, dtype=np.int64).reshape(-1, width)
+
+
+def _tuples(array):
+    return [tuple(row) for row in array.tolist()]
+
+
+def _encode_ragged(rows):
+    return {'flat': np.array([value for row in rows for value in row], dtype=np.int64),
+            'lengths': np.array([len(row) for row in rows], dtype=np.int64)}
+
+
+def _decode_ragged(arrays):
+    flat = arrays['flat'].tolist()
+    rows = []
+    start = 0
+    for length in arrays['lengths'].tolist():
+        rows.append(flat[start:start + length])
+        start += length
+    return rows
+
+
+def _encode_circuits(circuit_graph):
+    # load_data only fills in distances from node 0, everything else is -1
+    return {'coords': _int_rows([circuit[0][0] for circuit in circuit_graph], 3),
+            'first': np.array(circuit_graph[0][1] if circuit_graph else [], dtype=np.float64)}
+
+
+def _decode_circuits(arrays):
+    coords = _tuples(arrays['coords'])
+    first = arrays['first'].tolist()
+    count = len(coords)
+
+    circuit_graph = []
+    for i, node in enumerate(coords):
+        paths = [-1] * count
+        paths[i] = 0
+        paths[0] = first[i]
+        circuit_graph.append([[node], paths])
+    if circuit_graph:
+        circuit_graph[0][1] = first
+    return circuit_graph
+
+
+CODECS: Dict[int, Codec] = {
+    2: Codec(lambda ranges: {'ranges': _int_rows(ranges, 2)},
+             lambda arrays: _tuples(arrays['ranges'])),
+    4: Codec(lambda matrix: {'grid': np.array(matrix, dtype=np.uint8)},
+             lambda arrays: arrays['grid'].tolist()),
+    5: Codec(lambda data: {'ranges': _int_rows(data[0], 2), 'numbers': np.array(data[1], dtype=np.int64)},
+             lambda arrays: (_tuples(arrays['ranges']), arrays['numbers'].tolist())),
+    7: Codec(_encode_ragged, _decode_ragged),
+    8: Codec(_encode_circuits, _decode_circuits),
+    9: Codec(lambda coords: {'coords': _int_rows(coords, 2)},
+             lambda arrays: _tuples(arrays['coords'])),
+}
+
+
+def _file_digest(path: str) -> str:
+    return hashlib.sha256(map_input(path)).hexdigest()
+
+
+class ParseCache:
+    """Size-bounded directory of ``.npz`` parse results."""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.directory = directory or os.environ.get('AOC_CACHE_DIR', DEFAULT_DIR)
+        if max_bytes is None:
+            max_bytes = int(os.environ.get('AOC_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+        self.max_bytes = max_bytes
+        self._module_digests: Dict[int, str] = {}
+
+    def key(self, day: int, path: str) -> str:
+        if day not in self._module_digests:
+            self._module_digests[day] = _file_digest(os.path.join(day_dir(day), 'solution.py'))
+        digest = hashlib.sha256()
+        digest.update(f"{FORMAT_VERSION}:{day}:{self._module_digests[day]}:".encode())
+        digest.update(_file_digest(path).encode())
+        return f"day{day:02d}-{digest.hexdigest()[:40]}"
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, day: int, key: str) -> Optional[Any]:
+        """Return the cached parse result, or None on a miss."""
+        path = self.entry_path(key)
+        if day not in CODECS or not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                data = CODECS[day].decode(dict(archive))
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Truncated or stale entry: drop it and treat as a miss so put() rewrites it
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+            return None
+        os.utime(path)  # mtime doubles as the LRU clock
+        return data
+
+    def put(self, day: int, key: str, data: Any) -> bool:
+        """Store a parse result; returns False when the day can't be cached."""
+        if day not in CODECS:
+            return False
+        try:
+            arrays = CODECS[day].encode(data)
+        except (OverflowError, ValueError, TypeError):
+            # e.g. integers beyond int64: not worth a lossy or pickled fallback
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, self.entry_path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Drop least recently used entries until the cache fits its budget."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue  # evicted by a concurrent worker
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(os.path.join(self.directory, name))
+            total -= size
+
+    def clear(self) -> None:
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.npz'):
+                    os.unlink(os.path.join(self.directory, name))
+
+
+def cached_parse(cache: ParseCache, day: int, module, parse: Callable[[Any, str], Any], path: str) -> Any:
+    """Parse through the cache: load a hit, otherwise parse and store."""
+    if day not in CODECS:
+        return parse(module, path)
+
+    key = cache.key(day, path)
+    data = cache.get(day, key)
+    if data is None:
+        data = parse(module, path)
+        cache.put(day, key, data)
+    return data
@@ -0,0 +1,229 @@
+"""Command line entry point: ``python -m aoc <command>``."""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Optional
+
+from aoc import bench, server
+from aoc.batch import Throughput, expand_paths, solve_many
+from aoc.client import SolveClient
+from aoc.cache import ParseCache
+from aoc.days import engine_names, parse_days
+from aoc.generators import generate
+from aoc.instrument import Instrumentation, write_records
+from aoc.runner import format_table, run_days
+
+
+def select_days(spec: str) -> List[int]:
+    try:
+        return parse_days(spec)
+    except ValueError as e:
+        sys.exit(f"aoc: {e}")
+
+
+def make_cache(args) -> Optional[ParseCache]:
+    if args.cache or os.environ.get('AOC_CACHE') == '1':
+        return ParseCache()
+    return None
+
+
+def make_instrumentation(args) -> Optional[Instrumentation]:
+    if args.instrument or args.profile_dir:
+        return Instrumentation(memory=not args.no_memory, profile_dir=args.profile_dir)
+    return Instrumentation.from_env()
+
+
+def cmd_run(args) -> int:
+    days = select_days(args.days)
+    instrument = make_instrumentation(args)
+    start = time.perf_counter()
+    results = run_days(days, example=args.example, workers=args.workers, cache=make_cache(args),
+                       instrument=instrument, fused=not args.separate, engine=args.engine)
+    elapsed = time.perf_counter() - start
+
+    if instrument is not None and args.metrics:
+        records = [record for result in results for record in result['metrics']]
+        if args.metrics == '-':
+            write_records(records, sys.stdout)
+            return 0
+        with open(args.metrics, 'w') as f:
+            write_records(records, f)
+
+    print(format_table(results))
+    print(f"\nWall time: {elapsed * 1000:.2f} ms")
+    return 0
+
+
+def cmd_bench(args) -> int:
+    days = select_days(args.days)
+    sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else None
+    report = bench.run_benchmarks(days, sizes, seed=args.seed, repeat=args.repeat, cache=make_cache(args),
+                                  fused=not args.separate, engine=args.engine)
+
+    for record in report['results']:
+        stages = '  '.join(f"{stage}={seconds * 1000:.2f}ms" for stage, seconds in record['timings'].items())
+        print(f"day{record['day']:02d} size={record['size']:<8} {stages}")
+
+    if args.output:
+        bench.save(report, args.output)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressions = bench.compare(bench.load(args.compare), report, args.threshold)
+        for r in regressions:
+            engine = f" engine={r['engine']}" if r['engine'] != 'default' else ""
+            print(f"REGRESSION day{r['day']:02d} size={r['size']}{engine} {r['stage']}: "
+                  f"{r['before'] * 1000:.2f}ms -> {r['after'] * 1000:.2f}ms ({r['ratio']:.2f}x)")
+        return 1 if regressions else 0
+    return 0
+
+
+def cmd_cache(args) -> int:
+    cache = ParseCache()
+    if args.action == 'clear':
+        cache.clear()
+        print(f"Cleared {cache.directory}")
+    else:
+        entries = []
+        if os.path.isdir(cache.directory):
+            entries = [os.path.join(cache.directory, name) for name in os.listdir(cache.directory)
+                       if name.endswith('.npz')]
+        size = sum(os.path.getsize(path) for path in entries)
+        print(f"{cache.directory}: {len(entries)} entries, {size / 1024:.1f} KiB of {cache.max_bytes / 1024:.0f} KiB")
+    return 0
+
+
+def cmd_serve(args) -> int:
+    try:
+        server.serve(args.socket, workers=args.workers, cache=make_cache(args))
+    except RuntimeError as e:
+        sys.exit(f"aoc: {e}")
+    return 0
+
+
+def cmd_query(args) -> int:
+    try:
+        client = SolveClient(args.socket)
+    except OSError as e:
+        sys.exit(f"aoc: cannot reach solve server: {e}")
+
+    with client:
+        if args.path == '-':
+            response = client.solve(args.day, args.part, data=sys.stdin.buffer.read(), engine=args.engine)
+        else:
+            response = client.solve(args.day, args.part, path=args.path, engine=args.engine)
+
+    if args.json:
+        print(json.dumps(response))
+    elif not response['ok']:
+        print(f"aoc: {response['error']}", file=sys.stderr)
+    else:
+        for part, answer in response['answers'].items():
+            print(f"Part {part}: {answer}")
+        print(f"({response['elapsed_s'] * 1000:.2f} ms)")
+    return 0 if response['ok'] else 1
+
+
+def cmd_batch(args) -> int:
+    day = select_days(str(args.day))[0]
+    parts = (args.part,) if args.part else (1, 2)
+    throughput = Throughput()
+
+    for result in solve_many(day, expand_paths(args.paths), workers=args.workers, parts=parts,
+                             cache=make_cache(args), engine=args.engine):
+        throughput.add(result)
+        if args.json:
+            print(json.dumps(result), flush=True)
+        elif result['ok']:
+            answers = '  '.join(f"part{p}={result['answers'][p - 1]}" for p in parts)
+            print(f"{result['input']}: {answers}  ({sum(result['timings'].values()) * 1000:.2f} ms)", flush=True)
+        else:
+            print(f"{result['input']}: {result['error']}", flush=True)
+
+    print(throughput.summary(), file=sys.stderr)
+    return 1 if throughput.failed else 0
+
+
+def cmd_generate(args) -> int:
+    sys.stdout.write(generate(args.day, args.size, args.seed))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='aoc', description="Advent of Code 2025 tooling")
+    commands = parser.add_subparsers(dest='command', required=True)
+    engine_option = dict(default='default', choices=engine_names(),
+                         help="alternative backend for days that have one (others use their default)")
+
+    run = commands.add_parser('run', help="run days in parallel and print a timing table")
+    run.add_argument('days', nargs='?', default='1-9', help="day selection, e.g. 1-9 or 1,3,5-7")
+    run.add_argument('--example', action='store_true', help="use example.txt even if input.txt exists")
+    run.add_argument('--workers', type=int, help="process pool size (1 runs in-process)")
+    run.add_argument('--cache', action='store_true', help="reuse cached parse results (or set AOC_CACHE=1)")
+    run.add_argument('--separate', action='store_true', help="time part1/part2 separately instead of a fused solve")
+    run.add_argument('--engine', **engine_option)
+    run.add_argument('--instrument', action='store_true',
+                     help="measure wall/CPU time and memory peak per stage (or set AOC_INSTRUMENT=1)")
+    run.add_argument('--no-memory', action='store_true', help="skip tracemalloc when instrumenting")
+    run.add_argument('--profile-dir', help="dump a cProfile .pstats file per stage here (implies --instrument)")
+    run.add_argument('--metrics', default='-',
+                     help="where to write instrumentation JSON lines ('-' for stdout instead of the table)")
+    run.set_defaults(func=cmd_run)
+
+    bench_cmd = commands.add_parser('bench', help="time every stage over generated inputs of growing size")
+    bench_cmd.add_argument('days', nargs='?', default='1-9', help="day selection, e.g. 1-9 or 1,3,5-7")
+    bench_cmd.add_argument('--sizes', help="comma-separated sizes (default: per-day sweep)")
+    bench_cmd.add_argument('--seed', type=int, default=0)
+    bench_cmd.add_argument('--repeat', type=int, default=1, help="keep the best of N runs per stage")
+    bench_cmd.add_argument('--output', '-o', help="write JSON results to this file")
+    bench_cmd.add_argument('--compare', help="baseline JSON; exit 1 if any stage regressed")
+    bench_cmd.add_argument('--threshold', type=float, default=1.2, help="slowdown ratio counted as a regression")
+    bench_cmd.add_argument('--cache', action='store_true', help="time parse through the parse cache")
+    bench_cmd.add_argument('--separate', action='store_true', help="time part1/part2 separately instead of a fused solve")
+    bench_cmd.add_argument('--engine', **engine_option)
+    bench_cmd.set_defaults(func=cmd_bench)
+
+    cache_cmd = commands.add_parser('cache', help="inspect or clear the parse cache")
+    cache_cmd.add_argument('action', choices=['info', 'clear'])
+    cache_cmd.set_defaults(func=cmd_cache)
+
+    serve = commands.add_parser('serve', help="run the warm solve daemon on a Unix socket")
+    serve.add_argument('--socket', help="socket path (default: $XDG_RUNTIME_DIR/aoc2025-<uid>.sock)")
+    serve.add_argument('--workers', type=int, help="solver process count")
+    serve.add_argument('--cache', action='store_true', help="serve parses through the parse cache")
+    serve.set_defaults(func=cmd_serve)
+
+    query = commands.add_parser('query', help="ask a running solve daemon")
+    query.add_argument('day', type=int)
+    query.add_argument('path', help="input file, or - to send stdin")
+    query.add_argument('--part', type=int, choices=[1, 2], help="only this part (default: both)")
+    query.add_argument('--socket', help="socket path of the daemon")
+    query.add_argument('--json', action='store_true', help="print the raw JSON response")
+    query.add_argument('--engine', **engine_option)
+    query.set_defaults(func=cmd_query)
+
+    batch = commands.add_parser('batch', help="solve one day for many input files in parallel")
+    batch.add_argument('day', type=int)
+    batch.add_argument('paths', nargs='+', help="input files, or directories of *.txt inputs")
+    batch.add_argument('--part', type=int, choices=[1, 2], help="only this part (default: both)")
+    batch.add_argument('--workers', type=int, help="process pool size")
+    batch.add_argument('--cache', action='store_true', help="reuse cached parse results")
+    batch.add_argument('--json', action='store_true', help="print one JSON record per input")
+    batch.add_argument('--engine', **engine_option)
+    batch.set_defaults(func=cmd_batch)
+
+    gen = commands.add_parser('generate', help="print a synthetic input")
+    gen.add_argument('day', type=int)
+    gen.add_argument('size', type=int)
+    gen.add_argument('--seed', type=int, default=0)
+    gen.set_defaults(func=cmd_generate)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
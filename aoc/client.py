@@ -0,0 +1,50 @@
+"""Client side of the solve daemon in ``aoc.server``."""
+
+import base64
+import json
+import os
+import socket
+from typing import Dict, Iterable, Iterator, Optional
+
+from aoc.server import default_socket_path
+
+
+class SolveClient:
+    """One connection to the daemon; requests on it are answered in order."""
+
+    def __init__(self, socket_path: Optional[str] = None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(socket_path or default_socket_path())
+        self.reader = self.sock.makefile('rb')
+
+    def close(self) -> None:
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self) -> 'SolveClient':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def request(self, request: Dict) -> Dict:
+        self.sock.sendall(json.dumps(request).encode() + b'\n')
+        return json.loads(self.reader.readline())
+
+    def solve(self, day: int, part: Optional[int] = None, path: Optional[str] = None,
+              data: Optional[bytes] = None, engine: Optional[str] = None) -> Dict:
+        """Solve from a server-side ``path`` or from inline ``data`` bytes."""
+        request = {'day': day}
+        if part is not None:
+            request['part'] = part
+        if engine is not None:
+            request['engine'] = engine
+        if data is not None:
+            request['input_b64'] = base64.b64encode(data).decode()
+        else:
+            request['path'] = os.path.abspath(path)
+        return self.request(request)
+
+    def solve_many(self, requests: Iterable[Dict]) -> Iterator[Dict]:
+        for request in requests:
+            yield self.request(request)
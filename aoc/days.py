@@ -0,0 +1,190 @@
+"""Day registry: loads dayXX/solution.py modules and exposes uniform stages.
+
+Every day grew its own entry points (``read_input``/``parse_data``,
+``load_input_data``, ``load_data``/``solve``...), so each one is described
+here by a ``DaySpec`` that maps it onto the same parse -> part1 -> part2
+pipeline.  Days that answer both parts in one traversal provide ``solve``
+instead of ``part1``/``part2``.
+"""
+
+import importlib.util
+import os
+import sys
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class DaySpec(NamedTuple):
+    """Stage callables for one day, all taking the solution module first.
+
+    ``solve`` answers both parts in one pass; days may offer it next to
+    ``part1``/``part2``.  ``chained`` marks days whose part2 relies on state
+    part1 leaves behind.
+    """
+    parse: Callable[[Any, str], Any]
+    part1: Optional[Callable[[Any, Any], Any]] = None
+    part2: Optional[Callable[[Any, Any], Any]] = None
+    solve: Optional[Callable[[Any, Any], Any]] = None
+    chained: bool = False
+
+
+def _read_and_parse(module, path):
+    return module.parse_data(module.read_input(path))
+
+
+def _load(module, path):
+    return module.load_data(path)
+
+
+def _part1(module, data):
+    return module.part1(data)
+
+
+def _part2(module, data):
+    return module.part2(data)
+
+
+def _solve(module, data):
+    return module.solve(data)
+
+
+def _load_day06(module, path):
+    return module.load_worksheet(path)
+
+
+def _part1_day06(module, data):
+    return module.worksheet_part1(data)
+
+
+def _part2_day06(module, data):
+    return module.worksheet_part2(data)
+
+
+def _solve_day06(module, data):
+    return _part1_day06(module, data), _part2_day06(module, data)
+
+
+SPECS: Dict[int, DaySpec] = {
+    1: DaySpec(_read_and_parse, _part1, _part2, _solve),
+    2: DaySpec(_read_and_parse, _part1, _part2),
+    3: DaySpec(_read_and_parse, _part1, _part2),
+    4: DaySpec(_read_and_parse, _part1, _part2, _solve),
+    5: DaySpec(_read_and_parse,
+               lambda module, data: module.part1(*data),
+               lambda module, data: module.part2(data[0])),
+    6: DaySpec(_load_day06, _part1_day06, _part2_day06, _solve_day06),
+    7: DaySpec(_load, solve=_solve),
+    # solve_part1 annotates the circuit graph that solve_part2 relies on
+    8: DaySpec(_load,
+               lambda module, data: module.solve_part1(data),
+               lambda module, data: module.solve_part2(data),
+               chained=True),
+    9: DaySpec(_load,
+               lambda module, data: module.solve_part1(data),
+               lambda module, data: module.solve_part2(data),
+               _solve),
+}
+
+# Alternative backends per day, selected with ``--engine``; every day also
+# answers to 'default', which is its SPECS entry
+ENGINES: Dict[int, Dict[str, DaySpec]] = {
+    1: {
+        'numpy': DaySpec(lambda module, path: module.parse_rotations(module.read_input(path)),
+                         solve=lambda module, data: module.solve_numpy(*data)),
+        # Parsing happens inside the map workers, so "parse" only hands over the path
+        'parallel': DaySpec(lambda module, path: path,
+                            solve=lambda module, path: module.solve_parallel(path)),
+    },
+    2: {
+        'closed_form': DaySpec(_read_and_parse, solve=lambda module, data: module.solve_closed_form(data)),
+        'index': DaySpec(_read_and_parse, solve=lambda module, data: module.solve_index(data)),
+    },
+    3: {
+        'numpy': DaySpec(lambda module, path: module.parse_matrix(module.read_input(path)),
+                         solve=lambda module, data: module.solve_numpy(data)),
+    },
+    4: {
+        'numpy': DaySpec(lambda module, path: module.parse_grid(module.read_input(path)),
+                         solve=lambda module, data: module.solve_numpy(data)),
+        'bits': DaySpec(lambda module, path: module.parse_bits(module.read_input(path)),
+                        solve=lambda module, data: module.solve_bits(*data)),
+        # Part 1 only: rows are streamed from the file, so "parse" hands over the path
+        'stream': DaySpec(lambda module, path: path, lambda module, path: module.stream_part1(path)),
+    },
+    5: {
+        'numpy': DaySpec(_read_and_parse,
+                         lambda module, data: module.count_fresh(*data),
+                         lambda module, data: module.part2(data[0])),
+        'online': DaySpec(lambda module, path: module.read_input(path),
+                          solve=lambda module, data: module.solve_online(data)),
+    },
+    6: {
+        # Blocks are cut from the worksheet after loading, so "parse" only hands over the path
+        'parallel': DaySpec(lambda module, path: path, solve=lambda module, path: module.solve_parallel(path)),
+    },
+    7: {
+        'numpy': DaySpec(_load, solve=lambda module, data: module.solve_numpy(data)),
+        # Rows are read lazily while solving, so "parse" only hands over the path
+        'stream': DaySpec(lambda module, path: path, solve=lambda module, path: module.solve(module.stream_rows(path))),
+        'sparse': DaySpec(lambda module, path: module.index_columns(module.load_data(path)),
+                          solve=lambda module, data: module.solve_sparse(*data)),
+    },
+}
+
+DAYS = sorted(SPECS)
+
+
+def get_spec(day: int, engine: str = 'default') -> DaySpec:
+    """Return a day's stages for ``engine``, falling back to the default."""
+    return ENGINES.get(day, {}).get(engine, SPECS[day])
+
+
+def engine_names() -> List[str]:
+    return sorted({'default'} | {name for engines in ENGINES.values() for name in engines})
+
+
+def day_dir(day: int) -> str:
+    """Return the directory holding a day's solution and inputs."""
+    return os.path.join(ROOT, f"day{day:02d}")
+
+
+def load_module(day: int):
+    """Import dayXX/solution.py under a unique module name (cached)."""
+    name = f"day{day:02d}"
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = os.path.join(day_dir(day), "solution.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def input_path(day: int, example: bool = False) -> str:
+    """Resolve input.txt for a day, falling back to example.txt."""
+    path = os.path.join(day_dir(day), "input.txt")
+    if example or not os.path.exists(path):
+        path = os.path.join(day_dir(day), "example.txt")
+    return path
+
+
+def parse_days(spec: str) -> List[int]:
+    """Expand a selection like '1-9' or '1,3,5-7' into day numbers."""
+    days = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-')
+            days.update(range(int(start), int(end) + 1))
+        else:
+            days.add(int(part))
+
+    unknown = sorted(days - set(SPECS))
+    if unknown:
+        raise ValueError(f"No solution for day(s): {', '.join(map(str, unknown))}")
+    return sorted(days)
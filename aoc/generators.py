@@ -0,0 +1,137 @@
+"""Seeded synthetic input generators, one per day.
+
+Each generator takes a ``size`` knob and a ``random.Random`` and returns the
+puzzle input as text, so the same (day, size, seed) always yields the same
+file.  What ``size`` means differs per day:
+
+    day01  number of rotations
+    day02  width of each ID range
+    day03  number of battery banks
+    day04  grid side length
+    day05  number of fresh ranges (and as many ingredient IDs)
+    day06  number of worksheet problems
+    day07  manifold width (the manifold is as tall as it is wide)
+    day08  number of junction boxes
+    day09  number of polygon corners (rounded to an even count)
+"""
+
+import random
+from typing import Callable, Dict, Tuple
+
+
+def gen_day01(size: int, rng: random.Random) -> str:
+    return '\n'.join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size))
+
+
+def gen_day02(size: int, rng: random.Random, count: int = 10) -> str:
+    ranges = []
+    for _ in range(count):
+        digits = rng.randint(2, 12)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        ranges.append(f"{start}-{start + size - 1}")
+    return ','.join(ranges)
+
+
+def gen_day03(size: int, rng: random.Random, width: int = 100) -> str:
+    return '\n'.join(''.join(rng.choice('123456789') for _ in range(width)) for _ in range(size))
+
+
+def gen_day04(size: int, rng: random.Random, density: float = 0.6) -> str:
+    return '\n'.join(''.join('@' if rng.random() < density else '.' for _ in range(size))
+                     for _ in range(size))
+
+
+def gen_day05(size: int, rng: random.Random, space: int = 10 ** 12) -> str:
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, space)
+        ranges.append(f"{start}-{start + rng.randint(0, space // max(size, 1))}")
+    ids = [str(rng.randint(1, space)) for _ in range(size)]
+    return '\n'.join(ranges) + '\n\n' + '\n'.join(ids)
+
+
+def gen_day06(size: int, rng: random.Random, rows: int = 4) -> str:
+    lines = [[] for _ in range(rows)]
+    symbols = []
+    for _ in range(size):
+        width = rng.randint(1, 4)
+        numbers = [str(rng.randint(1, 10 ** rng.randint(1, width) - 1)) for _ in range(rows)]
+        # Sorting by length keeps every digit column free of inner blanks,
+        # which part 2 would otherwise read as two numbers
+        numbers.sort(key=len, reverse=rng.random() < 0.5)
+        width = max(len(n) for n in numbers)
+        align = str.rjust if rng.random() < 0.5 else str.ljust
+        for line, number in zip(lines, numbers):
+            line.append(align(number, width))
+        symbols.append(rng.choice('+*').ljust(width))
+    return '\n'.join(' '.join(line) for line in lines + [symbols])
+
+
+def gen_day07(size: int, rng: random.Random, density: float = 0.3) -> str:
+    width = max(size, 3)
+    rows = ['.' * width]
+    rows[0] = rows[0][:width // 2] + 'S' + rows[0][width // 2 + 1:]
+    for row in range(1, width):
+        if row % 2:
+            rows.append('.' * width)
+        else:
+            # Keep splitters off the edges so beams never leave the manifold
+            rows.append('.' + ''.join('^' if rng.random() < density else '.' for _ in range(width - 2)) + '.')
+    return '\n'.join(rows)
+
+
+def gen_day08(size: int, rng: random.Random, space: int = 100000) -> str:
+    return '\n'.join(','.join(str(rng.randint(0, space)) for _ in range(3)) for _ in range(size))
+
+
+def gen_day09(size: int, rng: random.Random, space: int = 100000) -> str:
+    # Rectilinear "skyline" polygon: a staircase of column tops over a flat
+    # floor, so consecutive corners always alternate vertical/horizontal edges
+    columns = max(size // 2 - 1, 1)
+    xs = sorted(rng.sample(range(1, space), columns + 1))
+    heights = []
+    for _ in range(columns):
+        height = rng.randint(2, space)
+        while heights and height == heights[-1]:
+            height = rng.randint(2, space)
+        heights.append(height)
+
+    points = [(xs[0], 1)]
+    for i, height in enumerate(heights):
+        points.append((xs[i], height))
+        points.append((xs[i + 1], height))
+    points.append((xs[-1], 1))
+    return '\n'.join(f"{x},{y}" for x, y in points)
+
+
+GENERATORS: Dict[int, Callable[[int, random.Random], str]] = {
+    1: gen_day01,
+    2: gen_day02,
+    3: gen_day03,
+    4: gen_day04,
+    5: gen_day05,
+    6: gen_day06,
+    7: gen_day07,
+    8: gen_day08,
+    9: gen_day09,
+}
+
+# Sweeps that finish in seconds with the current solutions
+DEFAULT_SIZES: Dict[int, Tuple[int, ...]] = {
+    1: (1000, 10000, 100000),
+    2: (100, 1000, 10000),
+    3: (100, 1000, 10000),
+    4: (20, 50, 100),
+    5: (100, 1000, 5000),
+    6: (100, 1000, 10000),
+    7: (50, 200, 1000),
+    8: (20, 50, 100),
+    9: (10, 50, 100),
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    """Generate a valid input for ``day`` at the given size."""
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}")
+    return GENERATORS[day](size, random.Random(f"{day}:{size}:{seed}")) + '\n'
@@ -0,0 +1,112 @@
+"""Shared memory-mapped input loading for all days.
+
+``map_input`` maps the file read-only instead of reading it into a str, and
+``iter_chunks`` hands out line-aligned ``memoryview`` slices of that mapping,
+so a big input is never copied as a whole (no ``read()``, no ``split('\\n')``
+list).  The line iterators split one such chunk at a time, which keeps the
+split in C while only a chunk is ever duplicated.  This replaced an earlier
+per-line zero-copy ``memoryview`` iterator: every day copies its lines into
+``bytes``/``str`` anyway, and finding each newline from Python made that
+iterator several times slower.
+
+Buffers passed to the iterators must support ``find`` (an ``mmap`` or
+``bytes`` object, as returned by ``map_input``).
+"""
+
+import mmap
+import re
+from typing import Iterator, List, Optional, Tuple, Union
+
+Buffer = Union[mmap.mmap, bytes]
+
+WHITESPACE = b' \t\r'
+CHUNK_SIZE = 1 << 20
+UNSIGNED_INT = re.compile(rb'\d+')
+SIGNED_INT = re.compile(rb'-?\d+')
+
+
+def map_input(path: str) -> Buffer:
+    """Memory-map a file read-only; empty files map to ``b''``."""
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses zero-length files
+            return b''
+
+
+def iter_chunks(buf: Buffer, chunk_size: int = CHUNK_SIZE, start: int = 0,
+                end: Optional[int] = None) -> Iterator[memoryview]:
+    """Yield zero-copy chunks of about ``chunk_size`` bytes that hold whole lines.
+
+    Chunks never contain the newline they were cut at, so splitting each
+    chunk on ``\n`` gives exactly the lines of the file.  ``start``/``end``
+    restrict this to a byte range that begins and ends on line boundaries
+    (see ``split_ranges``).
+    """
+    view = memoryview(buf)
+    size = len(buf) if end is None else end
+
+    while start < size:
+        end = start + chunk_size
+        if end < size:
+            cut = buf.rfind(b'\n', start, end)
+            if cut == -1:
+                cut = buf.find(b'\n', end)
+            end = size if cut == -1 else cut
+        else:
+            end = size - 1 if buf[size - 1] == ord('\n') else size
+        yield view[start:end]
+        start = end + 1
+
+
+def split_ranges(buf: Buffer, parts: int) -> List[Tuple[int, int]]:
+    """Cut a buffer into up to ``parts`` byte ranges of whole lines."""
+    size = len(buf)
+    ranges = []
+    start = 0
+    for i in range(1, parts + 1):
+        if start >= size:
+            break
+        end = size if i == parts else max(size * i // parts, start)
+        if end < size:
+            cut = buf.find(b'\n', end)
+            end = size if cut == -1 else cut + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _split_chunks(buf: Buffer, strip: bool, skip_blank: bool, text: bool):
+    newline, blanks, cr = ('\n', ' \t\r', '\r') if text else (b'\n', WHITESPACE, b'\r')
+    for chunk in iter_chunks(buf):
+        data = str(chunk, 'ascii') if text else chunk.tobytes()
+        for line in data.split(newline):
+            line = line.strip(blanks) if strip else line.rstrip(cr)
+            if line or not skip_blank:
+                yield line
+
+
+def iter_byte_lines(buf: Buffer, strip: bool = True, skip_blank: bool = True) -> Iterator[bytes]:
+    """Yield each line as ``bytes``, splitting a chunk at a time.
+
+    With ``strip`` surrounding blanks are trimmed, otherwise only a trailing
+    ``\\r`` is; ``skip_blank=False`` keeps empty lines (e.g. as separators).
+    Only one chunk of the file is ever held as a separate object.
+    """
+    return _split_chunks(buf, strip, skip_blank, text=False)
+
+
+def iter_text_lines(buf: Buffer, strip: bool = True, skip_blank: bool = True) -> Iterator[str]:
+    """Like ``iter_byte_lines`` but decodes to ``str`` a chunk at a time."""
+    return _split_chunks(buf, strip, skip_blank, text=True)
+
+
+def iter_ints(buf, signed: bool = False) -> Iterator[int]:
+    """Yield every integer in a buffer or line, in order.
+
+    Unsigned by default, since most inputs use '-' as a separator ("3-5").
+    """
+    pattern = SIGNED_INT if signed else UNSIGNED_INT
+    for match in pattern.finditer(buf):
+        yield int(match.group())
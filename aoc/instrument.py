@@ -0,0 +1,88 @@
+"""Opt-in per-stage instrumentation: wall time, CPU time, memory, profiles.
+
+The runner hands every stage (parse, part1, part2, solve) to
+``Instrumentation.measure`` when instrumentation is on, so the solutions
+themselves stay untouched.  Each stage yields one flat record:
+
+    {"day": 8, "stage": "part2", "wall_s": 0.09, "cpu_s": 0.09,
+     "peak_bytes": 181234, "pstats": "prof/day08-part2.pstats"}
+
+Turn it on with ``python -m aoc run --instrument`` or ``AOC_INSTRUMENT=1``;
+``--profile-dir``/``AOC_PROFILE_DIR`` additionally dumps a cProfile stats
+file per stage (read it with ``python -m pstats``).  tracemalloc makes
+stages noticeably slower, so ``peak_bytes`` and the timings of the same run
+should not be compared with uninstrumented ones.
+"""
+
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, IO, Iterable, Optional, Tuple
+
+
+class Instrumentation:
+    """Stage wrapper that measures time, CPU and tracemalloc peak."""
+
+    def __init__(self, memory: bool = True, profile_dir: Optional[str] = None):
+        self.memory = memory
+        self.profile_dir = profile_dir
+
+    @classmethod
+    def from_env(cls) -> Optional['Instrumentation']:
+        """Build from AOC_INSTRUMENT / AOC_PROFILE_DIR, or None when both are unset."""
+        profile_dir = os.environ.get('AOC_PROFILE_DIR') or None
+        if os.environ.get('AOC_INSTRUMENT') != '1' and profile_dir is None:
+            return None
+        return cls(memory=os.environ.get('AOC_INSTRUMENT_MEMORY', '1') == '1', profile_dir=profile_dir)
+
+    def measure(self, day: int, stage: str, fn: Callable, *args) -> Tuple[Any, Dict]:
+        """Run ``fn(*args)`` and return its result with a metrics record."""
+        started_tracing = False
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+
+        profiler = cProfile.Profile() if self.profile_dir else None
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            result = fn(*args)
+        finally:
+            if profiler:
+                profiler.disable()
+            cpu = time.process_time() - cpu
+            wall = time.perf_counter() - wall
+
+            peak = None
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                if started_tracing:
+                    tracemalloc.stop()
+
+        pstats_path = None
+        if profiler:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            pstats_path = os.path.join(self.profile_dir, f"day{day:02d}-{stage}.pstats")
+            profiler.dump_stats(pstats_path)
+
+        return result, {
+            'day': day,
+            'stage': stage,
+            'wall_s': wall,
+            'cpu_s': cpu,
+            'peak_bytes': peak,
+            'pstats': pstats_path,
+        }
+
+
+def write_records(records: Iterable[Dict], stream: IO[str]) -> None:
+    """Write metrics records as JSON lines."""
+    for record in records:
+        stream.write(json.dumps(record) + '\n')
@@ -0,0 +1,58 @@
+"""Online set of integers stored as disjoint inclusive intervals.
+
+Intervals live in two sorted parallel lists, ``starts`` and ``ends``.  An
+``add`` finds the run of intervals it overlaps or touches with two binary
+searches and replaces that run with a single slice assignment, so every
+interval is merged away at most once.  The number of covered integers is
+kept up to date on every insert.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Tuple
+
+
+class IntervalSet:
+    """Coalescing set of inclusive integer intervals."""
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]] = ()):
+        self.starts = []
+        self.ends = []
+        self.covered = 0
+        for start, end in intervals:
+            self.add(start, end)
+
+    def add(self, start: int, end: int) -> None:
+        """Insert [start, end], coalescing with every overlapping or adjacent interval."""
+        if start > end:
+            raise ValueError(f"Empty interval {start}-{end}")
+
+        # Intervals i..j-1 overlap or touch [start, end]
+        i = bisect_left(self.ends, start - 1)
+        j = bisect_right(self.starts, end + 1)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+            self.covered -= sum(self.ends[k] - self.starts[k] + 1 for k in range(i, j))
+
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+        self.covered += end - start + 1
+
+    def contains(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    __contains__ = contains
+
+    def total_covered(self) -> int:
+        """Number of integers in the set."""
+        return self.covered
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
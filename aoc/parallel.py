@@ -0,0 +1,47 @@
+"""Map a day's function over line-aligned byte ranges of one big input.
+
+Each worker maps the file itself and receives only ``(start, end)``
+offsets, so nothing but the per-range results crosses process boundaries.
+Workers look the function up by name on the day module, which keeps this
+independent of how (or whether) the module is importable by pickle.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, Optional, Sequence
+
+from aoc.days import load_module
+from aoc.inputs import map_input, split_ranges
+
+# Below this a pool costs more than it saves; run in-process instead
+MIN_PARALLEL_BYTES = 4 * 1024 * 1024
+
+
+def _map_range(day: int, func_name: str, path: str, start: int, end: int) -> Any:
+    return getattr(load_module(day), func_name)(map_input(path), start, end)
+
+
+def _call(day: int, func_name: str, args: Sequence) -> Any:
+    return getattr(load_module(day), func_name)(*args)
+
+
+def map_calls(day: int, func_name: str, calls: Iterable[Sequence], workers: Optional[int] = None) -> List[Any]:
+    """Call ``func_name(*args)`` of ``day`` once per argument tuple on a pool; results in order."""
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_call, day, func_name, args) for args in calls]
+        return [future.result() for future in futures]
+
+
+def map_ranges(day: int, func_name: str, path: str, workers: Optional[int] = None) -> List[Any]:
+    """Call ``func_name(buf, start, end)`` of ``day`` per range; results in file order."""
+    workers = workers or os.cpu_count() or 1
+    buf = map_input(path)
+    if workers == 1 or len(buf) < MIN_PARALLEL_BYTES:
+        return [getattr(load_module(day), func_name)(buf, 0, len(buf))]
+
+    # A few ranges per worker evens out lines of uneven length
+    ranges = split_ranges(buf, workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_map_range, day, func_name, path, start, end) for start, end in ranges]
+        return [future.result() for future in futures]
@@ -0,0 +1,108 @@
+"""Run several days side by side and report wall time per stage."""
+
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence
+
+from aoc.cache import ParseCache, cached_parse
+from aoc.days import SPECS, get_spec, input_path, load_module
+from aoc.instrument import Instrumentation
+
+STAGES = ['parse', 'part1', 'part2', 'solve']
+
+
+def run_day(day: int, path: Optional[str] = None, cache: Optional[ParseCache] = None,
+            instrument: Optional[Instrumentation] = None, parts: Sequence[int] = (1, 2),
+            fused: bool = True, engine: str = 'default') -> Dict:
+    """Run every stage of one day and collect answers and timings.
+
+    With a ``cache`` the parse stage is served from disk when possible; with
+    ``instrument`` each stage is measured and the records land in 'metrics'.
+    ``parts`` limits which parts run (answers of skipped parts stay None).
+    Both parts go through a day's fused ``solve`` unless ``fused`` is False
+    or the day has no separate parts.  ``engine`` picks an alternative
+    backend for days that have one (see ``aoc.days.ENGINES``).
+    """
+    module = load_module(day)
+    spec = get_spec(day, engine)
+    engine = engine if spec is not SPECS[day] else 'default'
+    # Solutions resolve relative names against their own directory
+    path = os.path.abspath(path or input_path(day))
+    timings = {}
+    metrics = []
+    answers = [None, None]
+
+    def run_stage(stage, fn, *args):
+        if instrument is not None:
+            result, record = instrument.measure(day, stage, fn, *args)
+            metrics.append(record)
+            timings[stage] = record['wall_s']
+            return result
+
+        start = time.perf_counter()
+        result = fn(*args)
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    # Solutions print progress of their own; keep it out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Cache codecs describe the default parse structures only
+        if cache is not None and engine == 'default':
+            data = run_stage('parse', cached_parse, cache, day, module, spec.parse, path)
+        else:
+            data = run_stage('parse', spec.parse, module, path)
+
+        use_solve = fused and set(parts) >= {1, 2}
+        if spec.solve is not None and (use_solve or spec.part1 is None):
+            answers = list(run_stage('solve', spec.solve, module, data))
+        else:
+            if 1 in parts or (2 in parts and spec.chained):
+                answers[0] = run_stage('part1', spec.part1, module, data)
+            if 2 in parts and spec.part2 is not None:
+                answers[1] = run_stage('part2', spec.part2, module, data)
+
+    result = {'day': day, 'input': path, 'engine': engine, 'answers': answers, 'timings': timings}
+    if instrument is not None:
+        result['metrics'] = metrics
+    return result
+
+
+def run_days(days: List[int], example: bool = False, workers: Optional[int] = None,
+             cache: Optional[ParseCache] = None, instrument: Optional[Instrumentation] = None,
+             fused: bool = True, engine: str = 'default') -> List[Dict]:
+    """Run days on a process pool; results come back in day order."""
+    paths = [input_path(day, example) for day in days]
+    if workers == 1:
+        return [run_day(day, path, cache, instrument, fused=fused, engine=engine) for day, path in zip(days, paths)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_day, days, paths, repeat(cache), repeat(instrument),
+                                 repeat((1, 2)), repeat(fused), repeat(engine)))
+
+
+def format_table(results: List[Dict]) -> str:
+    """Render run results as a fixed-width timing table (milliseconds)."""
+    stages = [stage for stage in STAGES if any(stage in r['timings'] for r in results)]
+    show_engine = any(r.get('engine', 'default') != 'default' for r in results)
+    header = ['Day'] + (['engine'] if show_engine else []) + [f"{stage} ms" for stage in stages]
+    header += ['total ms', 'Part 1', 'Part 2']
+
+    rows = []
+    for result in results:
+        timings = result['timings']
+        row = [f"{result['day']:02d}"] + ([result.get('engine', 'default')] if show_engine else [])
+        row += [f"{timings[stage] * 1000:.2f}" if stage in timings else '-' for stage in stages]
+        row.append(f"{sum(timings.values()) * 1000:.2f}")
+        row += [str(answer) for answer in result['answers']]
+        rows.append(row)
+
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = ['  '.join(cell.rjust(width) for cell, width in zip(header, widths))]
+    lines.append('  '.join('-' * width for width in widths))
+    for row in rows:
+        lines.append('  '.join(cell.rjust(width) for cell, width in zip(row, widths)))
+    return '\n'.join(lines)
@@ -0,0 +1,160 @@
+"""Warm solve daemon on a Unix domain socket.
+
+Starting Python, importing numpy and every ``dayXX/solution.py`` costs more
+than solving most inputs, so ``python -m aoc serve`` pays for it once: the
+pool workers preload every day module and then answer requests for as long
+as the server lives.
+
+The protocol is one JSON object per line in each direction.  A request
+names the day, optionally the part (1, 2, or omitted for both) and an
+``engine`` (see ``aoc.days.ENGINES``), and the
+input either as a ``path`` on the server's filesystem or inline as
+``input`` (text) / ``input_b64`` (bytes):
+
+    {"day": 7, "part": 2, "path": "day07/input.txt"}
+    -> {"ok": true, "day": 7, "answers": {"2": 40}, "timings": {...}, "elapsed_s": 0.0004}
+
+Failures come back as ``{"ok": false, "error": "..."}`` and leave the
+connection open for further requests.
+"""
+
+import base64
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from aoc.cache import ParseCache
+from aoc.days import DAYS, SPECS, load_module
+from aoc.runner import run_day
+
+
+def default_socket_path() -> str:
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"aoc2025-{os.getuid()}.sock")
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """Unlink a socket left by a dead server; refuse anything else at the path."""
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise RuntimeError(f"{socket_path} exists and is not a socket")
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except ConnectionRefusedError:
+        os.unlink(socket_path)  # nobody listening: stale socket from a previous run
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"already serving on {socket_path}")
+
+
+def _preload() -> None:
+    # Shutdown is the server's to handle; workers go away with the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    for day in DAYS:
+        load_module(day)
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def _solve(day: int, path: str, parts, cache: Optional[ParseCache], engine: str) -> Dict:
+    return run_day(day, path, cache, parts=parts, engine=engine)
+
+
+class SolveServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded socket front end; the actual solving happens on ``pool``."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, workers: Optional[int] = None, cache: Optional[ParseCache] = None):
+        _remove_stale_socket(socket_path)
+        super().__init__(socket_path, SolveHandler)
+        self.socket_path = socket_path
+        self.cache = cache
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_preload)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def solve(self, request: Dict) -> Dict:
+        day = int(request['day'])
+        if day not in SPECS:
+            raise ValueError(f"No solution for day {day}")
+        part = request.get('part')
+        parts = (1, 2) if part is None else (int(part),)
+        engine = request.get('engine', 'default')
+
+        inline = None
+        if 'input' in request:
+            inline = request['input'].encode()
+        elif 'input_b64' in request:
+            inline = base64.b64decode(request['input_b64'])
+        elif 'path' not in request:
+            raise ValueError("request needs 'path', 'input' or 'input_b64'")
+
+        start = time.perf_counter()
+        if inline is None:
+            result = self.pool.submit(_solve, day, os.path.abspath(request['path']), parts, self.cache,
+                                      engine).result()
+        else:
+            with tempfile.NamedTemporaryFile(prefix=f"aoc-day{day:02d}-", suffix='.txt') as f:
+                f.write(inline)
+                f.flush()
+                result = self.pool.submit(_solve, day, f.name, parts, self.cache, engine).result()
+
+        return {
+            'ok': True,
+            'day': day,
+            'engine': result['engine'],
+            'answers': {str(p): result['answers'][p - 1] for p in parts},
+            'timings': result['timings'],
+            'elapsed_s': time.perf_counter() - start,
+        }
+
+
+class SolveHandler(socketserver.StreamRequestHandler):
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.server.solve(json.loads(line))
+            except Exception as e:
+                response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+
+def serve(socket_path: Optional[str] = None, workers: Optional[int] = None,
+          cache: Optional[ParseCache] = None) -> None:
+    """Run the daemon until interrupted (SIGINT or SIGTERM)."""
+    socket_path = socket_path or default_socket_path()
+    signal.signal(signal.SIGTERM, _interrupt)
+    with SolveServer(socket_path, workers, cache) as server:
+        # Warm every worker up front rather than on the first requests
+        list(server.pool.map(time.sleep, [0] * server.workers))
+        print(f"Serving on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
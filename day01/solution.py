@@ -5,19 +5,30 @@ https://adventofcode.com/2025/day/1
 """
 
 import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.inputs import iter_chunks, iter_text_lines, map_input  # noqa: E402
+from aoc.parallel import map_ranges  # noqa: E402
+
+# "R17"/"L19" -> " 17"/"-19" for numpy's text parser
+SIGNED_TABLE = bytes.maketrans(b'RL', b' -')
+# With digits deleted first, "R17"/"L19" -> "0"/"1"
+DIRECTION_TABLE = bytes.maketrans(b'RL', b'01')
 
 
 def read_input(filename="input.txt"):
-    """Read and parse the input file."""
+    """Memory-map the input file."""
     filepath = os.path.join(os.path.dirname(__file__), filename)
-    with open(filepath, 'r') as f:
-        return f.read().strip()
+    return map_input(filepath)
 
 
 def parse_data(data):
     """Parse the input data into a usable format."""
-    lines = data.split('\n')
-    return [line.strip() for line in lines if line.strip()]
+    return list(iter_text_lines(data))
 
 
 def process_line(line, current_number):
@@ -42,35 +53,150 @@ def part1(data):
     return count
 
 
+def count_crossings(line, prev_number, number):
+    """Count the boundary crossings of one operation moving prev_number to number."""
+    hundreds = number // 100
+    prev_hundreds = prev_number // 100
+    if hundreds != prev_hundreds:
+        # Calculate boundary crossings with adjustments
+        crossings = abs(hundreds - prev_hundreds)
+
+        # Apply L-direction adjustments
+        if line[0] == 'L':
+            if number % 100 == 0:
+                crossings += 1
+            if prev_number % 100 == 0:
+                crossings -= 1
+
+        return crossings
+    return 1 if number % 100 == 0 and line[0] == 'L' else 0
+
+
 def part2(data):
     """Solve part 2 of the puzzle."""
     number = 50
     count = 0
-    prev_hundreds = 0  # 50 // 100
 
     for line in data:
         prev_number = number
         number = process_line(line, number)
+        count += count_crossings(line, prev_number, number)
 
-        hundreds = number // 100
-        if hundreds != prev_hundreds:
-            # Calculate boundary crossings with adjustments
-            crossings = abs(hundreds - prev_hundreds)
+    return count
 
-            # Apply L-direction adjustments
-            if line[0] == 'L':
-                if number % 100 == 0:
-                    crossings += 1
-                if prev_number % 100 == 0:
-                    crossings -= 1
 
-            count += crossings
-        elif number % 100 == 0 and line[0] == 'L':
-            count += 1
+def solve(data):
+    """Solve both parts in single traversal."""
+    number = 50
+    zero_hits = 0
+    count = 0
+
+    for line in data:
+        prev_number = number
+        number = process_line(line, number)
+        if number % 100 == 0:
+            zero_hits += 1
+        count += count_crossings(line, prev_number, number)
 
-        prev_hundreds = hundreds
+    return zero_hits, count
 
-    return count
+
+def parse_chunk(text):
+    """Parse one block of rotation lines into signed amounts and an L mask."""
+    values = np.fromstring(text.translate(SIGNED_TABLE), dtype=np.int64, sep=' ')
+    if values.all():
+        return values, values < 0
+    # "L0" and "R0" both parse to 0, so read the letters themselves
+    directions = np.fromstring(text.translate(DIRECTION_TABLE, b'0123456789'), dtype=np.int8, sep=' ')
+    return values, directions == 1
+
+
+def parse_rotations(data):
+    """Parse rotations into signed int64 amounts and a boolean L-direction mask."""
+    parsed = [parse_chunk(chunk.tobytes()) for chunk in iter_chunks(data)]
+    if not parsed:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+    return np.concatenate([p[0] for p in parsed]), np.concatenate([p[1] for p in parsed])
+
+
+def solve_numpy(rotations, left):
+    """Solve both parts with array operations; same rules as part1/part2."""
+    positions = 50 + np.cumsum(rotations)
+    previous = np.concatenate(([50], positions[:-1]))
+
+    at_zero = positions % 100 == 0
+    hundreds = positions // 100
+    prev_hundreds = previous // 100
+
+    # Crossings are the change in hundreds; L moves count landing on a
+    # multiple of 100 and, when the hundreds changed, not leaving one
+    moved = hundreds != prev_hundreds
+    adjust = at_zero.astype(np.int64) - ((previous % 100 == 0) & moved)
+    crossings = np.abs(hundreds - prev_hundreds) + np.where(left, adjust, 0)
+
+    return int(np.count_nonzero(at_zero)), int(crossings.sum())
+
+
+def summarize(rotations, left):
+    """Summarize a run of rotations independently of where the dial enters it.
+
+    Counts only depend on the entry position modulo 100, so the summary is
+    the net offset plus, for every entry residue r, the part 1 zero hits and
+    part 2 crossings the run produces.  Relative to the entry, a step of
+    |d| = 100k + m crosses k boundaries plus one more for the m residues r
+    that put its start within m of the next boundary; the L adjustments are
+    zero hits of the step's end (and, for moves, start) at residue -r.
+    """
+    offsets = np.cumsum(rotations)
+    prev_offsets = np.concatenate(([0], offsets[:-1]))
+    zero_residue = (-np.arange(100)) % 100
+
+    zeros = np.bincount(offsets % 100, minlength=100)[zero_residue]
+
+    amounts = np.abs(rotations)
+    spare = amounts % 100
+    lower = np.where(left, offsets, prev_offsets)[spare > 0] % 100
+    spare = spare[spare > 0]
+    first = (100 - spare - lower) % 100
+    window = np.cumsum(np.bincount(first, minlength=200) - np.bincount(first + spare, minlength=200))
+    extra = window[:100] + window[100:200]
+
+    landed = np.bincount(offsets[left] % 100, minlength=100)
+    left_from = np.bincount(prev_offsets[left & (rotations != 0)] % 100, minlength=100)
+    crossings = int((amounts // 100).sum()) + extra + (landed - left_from)[zero_residue]
+
+    net = int(offsets[-1]) if len(offsets) else 0
+    return net, zeros.astype(np.int64), crossings.astype(np.int64)
+
+
+def combine(first, second):
+    """Summary of running ``first`` and then ``second``."""
+    net, zeros, crossings = first
+    shift = (np.arange(100) + net) % 100
+    return net + second[0], zeros + second[1][shift], crossings + second[2][shift]
+
+
+def summary_answers(summary, start=50):
+    """Both answers for a summarized log entered at ``start``."""
+    _, zeros, crossings = summary
+    return int(zeros[start % 100]), int(crossings[start % 100])
+
+
+def summarize_range(data, start=0, end=None):
+    """Summarize the rotations in a line-aligned byte range, chunk by chunk."""
+    summary = (0, np.zeros(100, dtype=np.int64), np.zeros(100, dtype=np.int64))
+    for chunk in iter_chunks(data, start=start, end=end):
+        summary = combine(summary, summarize(*parse_chunk(chunk.tobytes())))
+    return summary
+
+
+def solve_parallel(filepath, workers=None):
+    """Map-reduce both parts over byte ranges of the log on a process pool."""
+    summaries = map_ranges(1, 'summarize_range', filepath, workers)
+    summary = (0, np.zeros(100, dtype=np.int64), np.zeros(100, dtype=np.int64))
+    for chunk_summary in summaries:
+        summary = combine(summary, chunk_summary)
+    return summary_answers(summary)
 
 
 def main():
@@ -81,9 +207,10 @@ def main():
     try:
         data = read_input("input.txt")
         parsed_data = parse_data(data)
+        result1, result2 = solve(parsed_data)
 
-        print(f"Part 1: {part1(parsed_data)}")
-        print(f"Part 2: {part2(parsed_data)}")
+        print(f"Part 1: {result1}")
+        print(f"Part 2: {result2}")
     except FileNotFoundError:
         print("input.txt not found. Please add your puzzle input.")
 
@@ -6,22 +6,33 @@ Advent of Code 2025 - Day 02
 import os
 import pprint
 import re
+import sys
+import tempfile
+import zipfile
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.cache import DEFAULT_DIR  # noqa: E402
+from aoc.inputs import iter_ints, map_input  # noqa: E402
+
+# Beyond this the index stops paying off: 12 digits is about 2M IDs (~50 MB)
+# and builds in a second or two, while each further two digits costs 10x
+MAX_INDEX_DIGITS = 12
 
 
 def read_input(filename="input.txt"):
-    """Read input file."""
+    """Memory-map the input file."""
     filepath = os.path.join(os.path.dirname(__file__), filename)
-    with open(filepath, 'r') as f:
-        return f.read().strip()
+    return map_input(filepath)
 
 
 def parse_data(data):
     """Parse comma-separated ranges into tuples."""
-    ranges = []
-    for range_str in data.split(','):
-        start, end = range_str.split('-')
-        ranges.append((int(start), int(end)))
-    return ranges
+    numbers = iter_ints(data)
+    return list(zip(numbers, numbers))
 
 
 def part1(data):
@@ -87,6 +98,184 @@ def part2(data):
     return total_sum
 
 
+def sum_with_period(lo, hi, length, period):
+    """Sum numbers in [lo, hi] of ``length`` digits made of one ``period``-digit block repeated.
+
+    Those numbers are block * (10^(length-period) + ... + 10^period + 1), so
+    the valid blocks form a contiguous range and the sum is an arithmetic
+    series times that geometric-series multiplier.
+    """
+    multiplier = (10 ** length - 1) // (10 ** period - 1)
+    first = max(10 ** (period - 1), -(-lo // multiplier))
+    last = min(10 ** period - 1, hi // multiplier)
+    if first > last:
+        return 0
+    return multiplier * (first + last) * (last - first + 1) // 2
+
+
+def sum_repeated(start, end, twice_only=False):
+    """Sum of IDs in [start, end] made of a block repeated at least twice.
+
+    With ``twice_only`` only blocks repeated exactly twice count (part 1).
+    Work grows with the number of digits, not with the width of the range.
+    """
+    total = 0
+    for length in range(len(str(start)), len(str(end)) + 1):
+        lo, hi = max(start, 10 ** (length - 1)), min(end, 10 ** length - 1)
+        if lo > hi:
+            continue
+
+        if twice_only:
+            if length % 2 == 0:
+                total += sum_with_period(lo, hi, length, length // 2)
+            continue
+
+        # A number with period e also has every period that e divides; keep
+        # only numbers whose smallest period is exactly ``period``
+        exact = {}
+        for period in (p for p in range(1, length) if length % p == 0):
+            exact[period] = sum_with_period(lo, hi, length, period) - sum(
+                exact[e] for e in exact if period % e == 0)
+        total += sum(exact.values())
+
+    return total
+
+
+def solve_closed_form(data):
+    """Solve both parts arithmetically instead of enumerating IDs."""
+    return (sum(sum_repeated(start, end, twice_only=True) for start, end in data),
+            sum(sum_repeated(start, end) for start, end in data))
+
+
+class InvalidIdIndex:
+    """Sorted repeated-pattern IDs up to ``max_digits`` digits with prefix sums.
+
+    Keeps one table for part 1 ('twice': a block repeated exactly twice) and
+    one for part 2 ('any': repeated at least twice).  A range sum is two
+    binary searches and a prefix-sum difference.  Prefix sums are stored
+    split at 10^9 into two int64 arrays so they never overflow.
+    """
+
+    SPLIT = 10 ** 9
+    KINDS = ('twice', 'any')
+
+    def __init__(self, max_digits, tables):
+        self.max_digits = max_digits
+        self.tables = tables  # kind -> (ids, prefix_hi, prefix_lo)
+
+    @classmethod
+    def build(cls, max_digits=MAX_INDEX_DIGITS):
+        if not 1 <= max_digits <= MAX_INDEX_DIGITS:
+            raise ValueError(f"max_digits must be between 1 and {MAX_INDEX_DIGITS}")
+
+        twice, repeated = [], []
+        for length in range(2, max_digits + 1):
+            for period in (p for p in range(1, length) if length % p == 0):
+                multiplier = (10 ** length - 1) // (10 ** period - 1)
+                ids = np.arange(10 ** (period - 1), 10 ** period, dtype=np.int64) * multiplier
+                repeated.append(ids)
+                if period * 2 == length:
+                    twice.append(ids)
+
+        tables = {}
+        for kind, parts in (('twice', twice), ('any', repeated)):
+            # Shorter periods repeat inside longer ones; unique() also sorts
+            ids = np.unique(np.concatenate(parts)) if parts else np.zeros(0, dtype=np.int64)
+            prefix_hi = np.concatenate(([0], np.cumsum(ids // cls.SPLIT)))
+            prefix_lo = np.concatenate(([0], np.cumsum(ids % cls.SPLIT)))
+            tables[kind] = (ids, prefix_hi, prefix_lo)
+        return cls(max_digits, tables)
+
+    def save(self, path):
+        arrays = {'max_digits': np.array(self.max_digits)}
+        for kind, (ids, prefix_hi, prefix_lo) in self.tables.items():
+            arrays.update({f"{kind}_ids": ids, f"{kind}_hi": prefix_hi, f"{kind}_lo": prefix_lo})
+        # Write to a temporary file and rename, so readers never see a partial index
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as archive:
+            tables = {kind: (archive[f"{kind}_ids"], archive[f"{kind}_hi"], archive[f"{kind}_lo"])
+                      for kind in cls.KINDS}
+            return cls(int(archive['max_digits']), tables)
+
+    def _check(self, end):
+        if end >= 10 ** self.max_digits:
+            raise ValueError(f"ID {end} has more than {self.max_digits} digits, rebuild the index")
+
+    def range_sum(self, start, end, kind='any'):
+        """Sum of indexed IDs in [start, end]."""
+        self._check(end)
+        ids, prefix_hi, prefix_lo = self.tables[kind]
+        lo, hi = bisect_left(ids, start), bisect_right(ids, end)
+        if lo >= hi:
+            return 0
+        return int(prefix_hi[hi] - prefix_hi[lo]) * self.SPLIT + int(prefix_lo[hi] - prefix_lo[lo])
+
+    def range_sums(self, ranges, kind='any'):
+        """Per-range sums for an (n, 2) array of inclusive ranges.
+
+        Returns an object array of exact Python ints, since sums of large
+        IDs can exceed int64.
+        """
+        ranges = np.asarray(ranges, dtype=np.int64).reshape(-1, 2)
+        if len(ranges):
+            self._check(int(ranges[:, 1].max()))
+        ids, prefix_hi, prefix_lo = self.tables[kind]
+        lo = np.searchsorted(ids, ranges[:, 0], side='left')
+        hi = np.maximum(np.searchsorted(ids, ranges[:, 1], side='right'), lo)
+        return (prefix_hi[hi] - prefix_hi[lo]).astype(object) * self.SPLIT + (prefix_lo[hi] - prefix_lo[lo])
+
+
+_indexes = {}
+
+
+def get_index(max_digits):
+    """Index covering ``max_digits``, kept per process and cached on disk.
+
+    Indexes live in their own subdirectory of the cache directory, out of
+    reach of the parse cache's LRU eviction and ``aoc cache clear``.
+    """
+    if max_digits not in _indexes:
+        directory = os.path.join(os.environ.get('AOC_CACHE_DIR', DEFAULT_DIR), 'day02-index')
+        path = os.path.join(directory, f"{max_digits}.npz")
+        index = None
+        if os.path.exists(path):
+            try:
+                index = InvalidIdIndex.load(path)
+            except (zipfile.BadZipFile, ValueError, KeyError, OSError):
+                pass  # truncated or stale file, rebuild it
+        if index is None:
+            index = InvalidIdIndex.build(max_digits)
+            os.makedirs(directory, exist_ok=True)
+            index.save(path)
+        _indexes[max_digits] = index
+    return _indexes[max_digits]
+
+
+def solve_index(data):
+    """Solve both parts with bulk lookups in a precomputed index.
+
+    Inputs with IDs longer than ``MAX_INDEX_DIGITS`` use ``solve_closed_form``.
+    """
+    if not data:
+        return 0, 0
+    digits = max(len(str(end)) for _, end in data)
+    if digits > MAX_INDEX_DIGITS:
+        return solve_closed_form(data)
+    index = get_index(digits)
+    ranges = np.array(data, dtype=np.int64)
+    return int(index.range_sums(ranges, 'twice').sum()), int(index.range_sums(ranges, 'any').sum())
+
+
 def main():
     """Main function to run the solution."""
     print("Advent of Code 2025 - Day 02")
@@ -4,62 +4,139 @@ Advent of Code 2025 - Day 03
 """
 
 import os
-from typing import List
+import sys
+from typing import List, Tuple
 
+import numpy as np
 
-def read_input(filename: str = "input.txt") -> str:
-    """Read input file."""
-    filepath = os.path.join(os.path.dirname(__file__), filename)
-    with open(filepath, 'r') as f:
-        return f.read().strip()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
+from aoc.inputs import Buffer, iter_text_lines, map_input  # noqa: E402
 
-def parse_data(data: str) -> List[str]:
-    """Parse newline-separated strings of digits."""
-    lines = data.strip().split('\n')
-    return [line.strip() for line in lines if line.strip()]
 
+def read_input(filename: str = "input.txt") -> Buffer:
+    """Memory-map the input file."""
+    filepath = os.path.join(os.path.dirname(__file__), filename)
+    return map_input(filepath)
 
-def part1(data: List[str]) -> int:
-    """Solve part 1 of the puzzle."""
-    total_sum = 0
 
-    for number_str in data:
-        search_range = number_str[:-1]
-        first_digit = max(search_range)
-        first_pos = number_str.index(first_digit)
-        value = int(first_digit + max(number_str[first_pos+1:]))
+def parse_data(data: Buffer) -> List[str]:
+    """Parse newline-separated strings of digits."""
+    return list(iter_text_lines(data))
 
-        total_sum += value
 
-    return total_sum
+def max_subsequence(line: str, k: int) -> str:
+    """Largest k-digit subsequence of ``line``, or '' when it is shorter than k.
 
+    A monotonic stack keeps the digits in non-increasing order, popping a
+    smaller digit whenever a larger one arrives and a drop is still allowed,
+    so each digit is pushed and popped at most once: O(n) for any k.
+    """
+    drops = len(line) - k
+    if drops < 0:
+        return ''
+
+    stack = []
+    for i, digit in enumerate(line):
+        while drops and stack and stack[-1] < digit:
+            stack.pop()
+            drops -= 1
+        stack.append(digit)
+        if not drops:
+            # Nothing more may be dropped, the rest of the line is kept as is
+            return ''.join(stack) + line[i + 1:]
+    return ''.join(stack[:k])
 
-def part2(data: List[str]) -> int:
-    """Solve part 2 of the puzzle."""
-    total_sum = 0
 
-    for number_str in data:
-        digits = []
-        start_pos = 0
+def total_joltage(data: List[str], k: int) -> int:
+    """Sum of the largest k-digit numbers of every bank."""
+    return sum(int(best) for best in (max_subsequence(line, k) for line in data) if best)
 
-        for i in range(12):
-            end_offset = 11 - i
-            search_range = number_str[start_pos:-end_offset] if end_offset > 0 else number_str[start_pos:]
 
-            if search_range:
-                max_digit = max(search_range)
-                digits.append(max_digit)
-                found_pos = number_str.index(max_digit, start_pos)
-                start_pos = found_pos + 1
-            else:
-                break
+def part1(data: List[str]) -> int:
+    """Solve part 1 of the puzzle."""
+    return total_joltage(data, 2)
 
-        if digits:
-            value = int(''.join(digits))
-            total_sum += value
 
-    return total_sum
+def part2(data: List[str]) -> int:
+    """Solve part 2 of the puzzle."""
+    return total_joltage(data, 12)
+
+
+def parse_matrix(data: Buffer) -> np.ndarray:
+    """View equal-length banks as a (rows, width) uint8 matrix of digit values."""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    end = len(raw)
+    while end and raw[end - 1] == ord('\n'):
+        end -= 1
+    if not end:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    width = data.find(b'\n', 0, end)
+    width = end if width < 0 else width
+    terminator = b'\n'
+    if width and raw[width - 1] == ord('\r'):
+        width -= 1
+        terminator = b'\r\n'
+        if raw[end - 1] == ord('\r'):
+            end -= 1
+
+    stride = width + len(terminator)
+    if (end + len(terminator)) % stride:
+        raise ValueError("Banks differ in length, the matrix mode needs a rectangular input")
+    rows = np.concatenate((raw[:end], np.frombuffer(terminator, dtype=np.uint8))).reshape(-1, stride)
+    matrix = rows[:, :width] - np.uint8(ord('0'))
+    # Any misplaced line break lands in the digit columns and wraps past 9
+    if np.any(matrix > 9) or np.any(rows[:, width:] != np.frombuffer(terminator, dtype=np.uint8)):
+        raise ValueError("Banks differ in length, the matrix mode needs a rectangular input")
+    return matrix
+
+
+def best_pairs(matrix: np.ndarray) -> np.ndarray:
+    """Part 1 for every row: the largest two-digit subsequence."""
+    rows, width = matrix.shape
+    if width < 2:
+        return np.zeros(rows, dtype=np.int64)
+    first = matrix[:, :-1].argmax(axis=1)  # argmax picks the leftmost maximum
+    suffix_max = np.maximum.accumulate(matrix[:, ::-1], axis=1)[:, ::-1]
+    second = suffix_max[np.arange(rows), first + 1]
+    return matrix[np.arange(rows), first].astype(np.int64) * 10 + second
+
+
+def select_digits(matrix: np.ndarray, k: int) -> np.ndarray:
+    """Largest k-digit subsequence of every row, as a (rows, k) digit matrix.
+
+    The same greedy choice as ``max_subsequence``, taken for all rows in
+    lockstep: digit j is the leftmost maximum between the row's previous
+    pick and column ``width - k + j``.
+    """
+    rows, width = matrix.shape
+    if width < k:
+        return np.zeros((rows, 0), dtype=np.uint8)
+
+    span = width - k + 1
+    offsets = np.arange(span)
+    start = np.zeros(rows, dtype=np.intp)
+    digits = np.empty((rows, k), dtype=np.uint8)
+    for j in range(k):
+        window = matrix[:, j:j + span]
+        # Shift digits up by one so 0 marks columns before the row's start
+        masked = np.where(offsets + j >= start[:, None], window + np.uint8(1), np.uint8(0))
+        pick = masked.argmax(axis=1)
+        digits[:, j] = window[np.arange(rows), pick]
+        start = j + pick + 1
+    return digits
+
+
+def sum_numbers(digits: np.ndarray) -> int:
+    """Sum the rows of a digit matrix as decimal numbers, without overflow."""
+    k = digits.shape[1]
+    return sum(10 ** (k - 1 - j) * int(digits[:, j].sum(dtype=np.int64)) for j in range(k))
+
+
+def solve_numpy(matrix: np.ndarray) -> Tuple[int, int]:
+    """Solve both parts over the digit matrix; same answers as part1/part2."""
+    return int(best_pairs(matrix).sum()), sum_numbers(select_digits(matrix, 12))
 
 
 def main() -> None:
@@ -4,25 +4,30 @@ Advent of Code 2025 - Day 04
 """
 
 import os
-from typing import List
+import sys
+from typing import BinaryIO, Iterable, Iterator, List, Tuple, Union
 
+import numpy as np
 
-def read_input(filename: str = "input.txt") -> str:
-    """Read input file."""
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.inputs import Buffer, iter_byte_lines, map_input  # noqa: E402
+
+# Maps '@' to 1 and every other byte to 0
+ROLL_TABLE = bytes(1 if i == ord('@') else 0 for i in range(256))
+# Maps '@' to '1' and every other byte to '0', for int(row, 2)
+BIT_TABLE = bytes(ord('1') if i == ord('@') else ord('0') for i in range(256))
+
+
+def read_input(filename: str = "input.txt") -> Buffer:
+    """Memory-map the input file."""
     filepath = os.path.join(os.path.dirname(__file__), filename)
-    with open(filepath, 'r') as f:
-        return f.read().strip()
+    return map_input(filepath)
 
 
-def parse_data(data: str) -> List[List[int]]:
+def parse_data(data: Buffer) -> List[List[int]]:
     """Parse input data into integer matrix where '@' = 1, '.' = 0."""
-    lines = data.strip().split('\n')
-    matrix = []
-    for line in lines:
-        if line.strip():
-            row = [1 if char == '@' else 0 for char in line.strip()]
-            matrix.append(row)
-    return matrix
+    return [list(line.translate(ROLL_TABLE)) for line in iter_byte_lines(data)]
 
 
 def get_neighbor_sum(matrix: List[List[int]], row: int, col: int) -> int:
@@ -42,15 +47,12 @@ def get_neighbor_sum(matrix: List[List[int]], row: int, col: int) -> int:
     return neighbor_sum
 
 
-def solve_matrix(data: List[List[int]], iterative: bool = False) -> int:
-    """Solve matrix problem with optional iterative mode."""
+def removal_rounds(data: List[List[int]]) -> Iterator[int]:
+    """Yield how many cells each round removes; stops once a round removes none."""
     rows, cols = len(data), len(data[0])
     matrix = [row[:] for row in data]
-    counter = 0
 
-    changed = True
-    while changed:
-        changed = False
+    while True:
         positions_to_change = []
 
         for row in range(rows):
@@ -59,18 +61,61 @@ def solve_matrix(data: List[List[int]], iterative: bool = False) -> int:
                     continue
 
                 if get_neighbor_sum(matrix, row, col) < 4:
-                    counter += 1
-                    if iterative:
-                        positions_to_change.append((row, col))
+                    positions_to_change.append((row, col))
+
+        if not positions_to_change:
+            return
+        yield len(positions_to_change)
+
+        for r, c in positions_to_change:
+            matrix[r][c] = 0
+
+
+def peel_rounds(data: List[List[int]]) -> Iterator[int]:
+    """Yield the same per-round removal counts as ``removal_rounds`` without rescanning.
 
-        if iterative and positions_to_change:
-            changed = True
-            for r, c in positions_to_change:
-                matrix[r][c] = 0
-        else:
-            break
+    Like a k-core peel: neighbor counts are kept per cell and only the 8
+    neighbors of removed rolls are updated.  The worklist is processed one
+    layer at a time, and a roll joins the next layer the moment its count
+    drops below 4, so layers are exactly the rounds of the full rescan.
+    """
+    if not data:
+        return
+    rows, cols = len(data), len(data[0])
+    width = cols + 2
+    # Flat grid with a border of empty cells, so neighbors need no bounds checks
+    grid = bytearray(width * (rows + 2))
+    for row, cells in enumerate(data, 1):
+        grid[row * width + 1:row * width + 1 + cols] = bytes(cells)
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+
+    counts = [0] * len(grid)
+    layer = []
+    for cell, roll in enumerate(grid):
+        if roll:
+            counts[cell] = count = sum(grid[cell + offset] for offset in offsets)
+            if count < 4:
+                layer.append(cell)
+
+    while layer:
+        yield len(layer)
+        for cell in layer:
+            grid[cell] = 0
+        next_layer = []
+        for cell in layer:
+            for offset in offsets:
+                neighbor = cell + offset
+                if grid[neighbor]:
+                    counts[neighbor] -= 1
+                    if counts[neighbor] == 3:
+                        next_layer.append(neighbor)
+        layer = next_layer
 
-    return counter
+
+def solve_matrix(data: List[List[int]], iterative: bool = False) -> int:
+    """Solve matrix problem with optional iterative mode."""
+    rounds = removal_rounds(data)
+    return sum(rounds) if iterative else next(rounds, 0)
 
 
 def part1(data: List[List[int]]) -> int:
@@ -80,24 +125,158 @@ def part1(data: List[List[int]]) -> int:
 
 def part2(data: List[List[int]]) -> int:
     """Iteratively count and remove cells where sum of 8 neighbors is less than 4."""
-    return solve_matrix(data, iterative=True)
+    return sum(peel_rounds(data))
+
+
+def solve(data: List[List[int]]) -> Tuple[int, int]:
+    """Solve both parts in single traversal; part 1 is the first round of part 2."""
+    rounds = peel_rounds(data)
+    first = next(rounds, 0)
+    return first, first + sum(rounds)
+
+
+def parse_grid(data: Buffer) -> np.ndarray:
+    """Parse the grid into a uint8 array of rolls with a one-cell border of zeros."""
+    rows = [line.translate(ROLL_TABLE) for line in iter_byte_lines(data)]
+    if not rows:
+        return np.zeros((2, 2), dtype=np.uint8)
+    grid = np.frombuffer(b''.join(rows), dtype=np.uint8).reshape(len(rows), -1)
+    return np.pad(grid, 1)
+
+
+def neighbor_counts(padded: np.ndarray) -> np.ndarray:
+    """Count the rolls among the 8 neighbors of every interior cell."""
+    rows, cols = padded.shape[0] - 2, padded.shape[1] - 2
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for row_offset in range(3):
+        for col_offset in range(3):
+            if row_offset != 1 or col_offset != 1:
+                counts += padded[row_offset:row_offset + rows, col_offset:col_offset + cols]
+    return counts
+
+
+def removal_rounds_numpy(padded: np.ndarray) -> Iterator[int]:
+    """Array version of ``removal_rounds``: each round removes every accessible roll at once."""
+    padded = padded.copy()
+    interior = padded[1:-1, 1:-1]
+    while True:
+        accessible = (interior == 1) & (neighbor_counts(padded) < 4)
+        removed = int(np.count_nonzero(accessible))
+        if not removed:
+            return
+        yield removed
+        interior[accessible] = 0
+
+
+def solve_numpy(padded: np.ndarray) -> Tuple[int, int]:
+    """Solve both parts over the padded array; same answers as ``solve``."""
+    rounds = removal_rounds_numpy(padded)
+    first = next(rounds, 0)
+    return first, first + sum(rounds)
+
+
+def parse_bits(data: Buffer) -> Tuple[List[int], int]:
+    """Pack every row into one int, one bit per cell; returns the rows and the width."""
+    rows = [int(line.translate(BIT_TABLE), 2) for line in iter_byte_lines(data)]
+    width = len(next(iter_byte_lines(data), b''))
+    return rows, width
+
+
+def accessible_bits(above: int, row: int, below: int, mask: int) -> int:
+    """Bits of the rolls in ``row`` with fewer than 4 rolls among their 8 neighbors.
+
+    The 8 shifted neighbor masks go through a bit-parallel counter: ``ones``
+    and ``twos`` hold the low bits of every cell's count and ``fours`` is
+    set once a count reaches 4, so each big-int operation handles a whole
+    row.
+    """
+    ones = twos = fours = 0
+    for neighbors in ((above << 1) & mask, above, above >> 1,
+                      (row << 1) & mask, row >> 1,
+                      (below << 1) & mask, below, below >> 1):
+        carry = ones & neighbors
+        ones ^= neighbors
+        fours |= twos & carry
+        twos ^= carry
+    return row & ~fours
+
+
+def bit_rounds(rows: List[int], width: int) -> Iterator[int]:
+    """Bit-packed ``removal_rounds``; only rows next to last round's removals are rechecked."""
+    rows = rows[:]
+    mask = (1 << width) - 1
+    padded = [0] + rows + [0]
+    dirty = range(1, len(padded) - 1)
+    while True:
+        removals = {}
+        for r in dirty:
+            accessible = accessible_bits(padded[r - 1], padded[r], padded[r + 1], mask)
+            if accessible:
+                removals[r] = accessible
+        if not removals:
+            return
+        yield sum(bin(accessible).count('1') for accessible in removals.values())
+
+        for r, accessible in removals.items():
+            padded[r] &= ~accessible
+        dirty = sorted({n for r in removals for n in (r - 1, r, r + 1) if 0 < n < len(padded) - 1})
+
+
+def solve_bits(rows: List[int], width: int) -> Tuple[int, int]:
+    """Solve both parts over bit-packed rows; same answers as ``solve``."""
+    rounds = bit_rounds(rows, width)
+    first = next(rounds, 0)
+    return first, first + sum(rounds)
+
+
+def count_accessible_stream(lines: Iterable[bytes]) -> int:
+    """Part 1 over rows arriving one at a time, holding only three packed rows."""
+    above = row = 0
+    mask = None
+    count = 0
+    for line in lines:
+        line = line.rstrip(b'\r\n')
+        if not line:
+            continue
+        if mask is None:
+            mask = (1 << len(line)) - 1
+        below = int(line.translate(BIT_TABLE), 2)
+        count += bin(accessible_bits(above, row, below, mask)).count('1')
+        above, row = row, below
+    if mask is not None:
+        count += bin(accessible_bits(above, row, 0, mask)).count('1')
+    return count
+
+
+def stream_part1(source: Union[str, BinaryIO] = '-') -> int:
+    """Solve part 1 straight from a file path, '-' for stdin, or a binary stream."""
+    if not isinstance(source, str):
+        return count_accessible_stream(source)
+    if source == '-':
+        return count_accessible_stream(sys.stdin.buffer)
+    with open(source, 'rb') as f:
+        return count_accessible_stream(f)
 
 
 def main() -> None:
     """Main function to run the solution."""
+    if len(sys.argv) > 1:
+        # Part 1 only, streamed from a path or '-' (stdin) in O(width) memory
+        print(stream_part1(sys.argv[1]))
+        return
+
     print("Advent of Code 2025 - Day 04")
     print("=" * 30)
 
     try:
         data = read_input("input.txt")
         parsed_data = parse_data(data)
+        result1, result2 = solve(parsed_data)
 
         print("Part 1:")
-        result1 = part1(parsed_data)
         print(result1)
 
         print(f"\nPart 2:")
-        result2 = part2(parsed_data)
         print(result2)
     except FileNotFoundError:
         print("input.txt not found. Please add your puzzle input.")
@@ -4,68 +4,98 @@ Advent of Code 2025 - Day 05
 """
 
 import os
+import sys
+from bisect import bisect_right
 
+import numpy as np
 
-def read_input(filename="input.txt"):
-    """Read input file."""
-    filepath = os.path.join(os.path.dirname(__file__), filename)
-    with open(filepath, 'r') as f:
-        return f.read().strip()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
+from aoc.inputs import iter_byte_lines, map_input  # noqa: E402
+from aoc.intervals import IntervalSet  # noqa: E402
 
-def parse_data(data):
-    """Parse ranges and numbers from input."""
-    lines = data.split('\n')
-    ranges = []
 
-    # Process range lines until empty line
-    i = 0
-    while i < len(lines) and lines[i].strip():
-        line = lines[i].strip()
-        new_range = (int(line.split('-')[0]), int(line.split('-')[1]))
+def read_input(filename="input.txt"):
+    """Memory-map the input file."""
+    filepath = os.path.join(os.path.dirname(__file__), filename)
+    return map_input(filepath)
 
-        # Merge with overlapping ranges (handles fully contained ranges automatically)
-        min_val, max_val = new_range
-        to_remove = []
 
-        for j, existing_range in enumerate(ranges):
-            # Check if ranges overlap: not (r1[1] < r2[0] or r2[1] < r1[0])
-            if not (new_range[1] < existing_range[0] or existing_range[1] < new_range[0]):
-                min_val = min(min_val, existing_range[0])
-                max_val = max(max_val, existing_range[1])
-                to_remove.append(j)
+def merge_ranges(ranges):
+    """Merge inclusive ranges into sorted, disjoint ones in O(n log n)."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
 
-        # Remove merged ranges
-        for j in reversed(to_remove):
-            ranges.pop(j)
 
-        ranges.append((min_val, max_val))
+def parse_data(data):
+    """Parse ranges and numbers from input; ranges come back merged and sorted."""
+    lines = iter_byte_lines(data, skip_blank=False)
+    ranges = []
 
-        i += 1
+    # Process range lines until empty line
+    for line in lines:
+        if not line:
+            break
+        start, end = line.split(b'-')
+        ranges.append((int(start), int(end)))
 
     # Parse numbers after empty line
-    i += 1  # Skip empty line
-    numbers = [int(line.strip()) for line in lines[i:] if line.strip()]
+    numbers = [int(line) for line in lines if line]
 
-    return ranges, numbers
+    return merge_ranges(ranges), numbers
 
 
 def part1(ranges, numbers):
-    """Count numbers within ranges."""
+    """Count numbers within ranges (sorted and disjoint, as parse_data returns them)."""
+    starts = [start for start, _ in ranges]
     counter = 0
     for number in numbers:
-        for range_tuple in ranges:
-            if range_tuple[0] <= number <= range_tuple[1]:
-                counter += 1
-                break
+        i = bisect_right(starts, number) - 1
+        if i >= 0 and number <= ranges[i][1]:
+            counter += 1
     return counter
 
 
+def count_fresh(ranges, numbers):
+    """Bulk part 1 for an int64 array of IDs, using searchsorted on the range starts."""
+    bounds = np.array(ranges, dtype=np.int64).reshape(-1, 2)
+    numbers = np.asarray(numbers, dtype=np.int64)
+    if not len(bounds):
+        return 0
+    i = np.searchsorted(bounds[:, 0], numbers, side='right') - 1
+    inside = (i >= 0) & (numbers <= bounds[np.maximum(i, 0), 1])
+    return int(np.count_nonzero(inside))
+
+
 def part2(ranges):
     """Sum of range spans plus count of ranges."""
     return sum(max_val - min_val for min_val, max_val in ranges) + len(ranges)
 
 
+def solve_online(data):
+    """Solve both parts in one pass, with ranges and IDs in any order.
+
+    Ranges go into an ``IntervalSet`` as they are read and each ID is
+    checked against the ranges seen so far, which for the puzzle's layout
+    (all ranges first) gives the usual answers.
+    """
+    fresh_ranges = IntervalSet()
+    fresh = 0
+    for line in iter_byte_lines(data):
+        if b'-' in line:
+            start, end = line.split(b'-')
+            fresh_ranges.add(int(start), int(end))
+        elif int(line) in fresh_ranges:
+            fresh += 1
+    return fresh, fresh_ranges.total_covered()
+
+
 def main():
     """Main function to run the solution."""
     print("Advent of Code 2025 - Day 05")
@@ -6,16 +6,38 @@ Advent of Code 2025 - Day 06
 import os
 import re
 import math
+import sys
+from collections import namedtuple
 
+import numpy as np
 
-def load_input_data(parse_as_numbers=True):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.inputs import iter_byte_lines, iter_text_lines, map_input  # noqa: E402
+from aoc.parallel import MIN_PARALLEL_BYTES, map_calls  # noqa: E402
+
+OPERATIONS = {'+': sum, '*': math.prod}
+# int64 digit accumulation holds at most 18 digits per number
+MAX_DIGITS = 18
+POWERS = 10 ** np.arange(MAX_DIGITS, dtype=np.int64)
+
+# ``regular`` is False when the column layout does not match what the
+# operator line implies; such worksheets go through part1/part2 instead
+Worksheet = namedtuple('Worksheet', 'grid problems path regular')
+
+
+def load_input_data(parse_as_numbers=True, filename="input.txt"):
     """Unified input loader with flexible parsing."""
-    filename = "input.txt" if os.path.exists(os.path.join(os.path.dirname(__file__), "input.txt")) else "example.txt"
-    with open(os.path.join(os.path.dirname(__file__), filename), 'r') as f:
-        lines = f.read().strip().split('\n')
+    filepath = os.path.join(os.path.dirname(__file__), filename)
+    if not os.path.exists(filepath):
+        filepath = os.path.join(os.path.dirname(__file__), "example.txt")
+    # Column alignment matters here, so lines keep their padding
+    lines = list(iter_text_lines(map_input(filepath), strip=False))
+    while lines and not lines[-1].strip():
+        lines.pop()
 
     raw_lines = [line for line in lines[:-1] if line.strip()]
-    symbol_line = lines[-1]
+    symbol_line = lines[-1].rstrip()
 
     if parse_as_numbers:
         # Part 1: Convert lines to integer matrix, symbols to list
@@ -31,8 +53,6 @@ def load_input_data(parse_as_numbers=True):
 
 def apply_operations(data, symbols, axis='column'):
     """Apply symbol operations to data along specified axis."""
-    operations = {'+': sum, '*': math.prod}
-
     results = []
     for i, symbol in enumerate(symbols):
         # Extract values based on axis: columns vs rows
@@ -42,7 +62,7 @@ def apply_operations(data, symbols, axis='column'):
             values = data[i] if i < len(data) else []  # Get row i
 
         # Apply operation (+sum or *product) to the values
-        results.append(operations[symbol](values))
+        results.append(OPERATIONS[symbol](values))
     return results
 
 
@@ -88,15 +108,230 @@ def transpose_and_segment(raw_lines, spacing):
     return result
 
 
-def part1():
+def load_worksheet(filename="input.txt"):
+    """Read the worksheet once into a 2-D byte array and locate its problems.
+
+    Returns a ``Worksheet`` holding the digit rows as a (rows, width) uint8
+    array padded with spaces, and one ``(start, end, symbol)`` per problem:
+    a run of columns between all-blank columns, with its operator from the
+    last line.  The array views only agree with the operator-line spacing
+    of part1/part2 when every problem starts with its operator and holds
+    exactly one number per row; ``regular`` records whether that holds.
+    """
+    filepath = os.path.join(os.path.dirname(__file__), filename)
+    if not os.path.exists(filepath):
+        filepath = os.path.join(os.path.dirname(__file__), "example.txt")
+    lines = list(iter_byte_lines(map_input(filepath), strip=False, skip_blank=False))
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if not lines:
+        return Worksheet(np.zeros((0, 0), dtype=np.uint8), [], filepath, True)
+
+    lines = [line for line in lines[:-1] if line.strip()] + [lines[-1]]
+    width = max(len(line) for line in lines)
+    grid = np.frombuffer(b''.join(line.ljust(width) for line in lines), dtype=np.uint8).reshape(len(lines), width)
+
+    # Problems are the runs of columns holding anything but blanks
+    used = np.concatenate(([False], (grid != ord(' ')).any(axis=0), [False]))
+    edges = np.flatnonzero(used[1:] != used[:-1])
+    symbol_line = lines[-1]
+    problems = []
+    for start, end in zip(edges[::2].tolist(), edges[1::2].tolist()):
+        symbol = symbol_line[start:end].strip()
+        problems.append((start, end, symbol.decode() if symbol else ''))
+
+    regular = not problems or (
+        problems[0][0] == 0
+        and all(symbol in OPERATIONS and symbol_line[start:start + 1] == symbol.encode()
+                for start, _, symbol in problems)
+        and bool(np.all(number_counts(grid[:-1], np.array([start for start, _, _ in problems])) == 1)))
+    return Worksheet(grid[:-1], problems, filepath, regular)
+
+
+def number_counts(cells, starts):
+    """How many separate digit runs each row has within each column group."""
+    digits = (cells >= ord('0')) & (cells <= ord('9'))
+    run_starts = digits & ~np.pad(digits, ((0, 0), (1, 0)))[:, :-1]
+    if not len(starts) or not cells.shape[0]:
+        return np.zeros((cells.shape[0], len(starts)), dtype=np.int64)
+    return np.add.reduceat(run_starts, starts, axis=1, dtype=np.int64)
+
+
+def digit_numbers(cells, starts):
+    """Read the numbers left to right in every row of each column group.
+
+    ``starts`` are the first columns of consecutive groups; within a row and
+    group, digits are accumulated into one int64 number with blanks skipped,
+    all without a Python loop over cells.  Returns (rows, groups) numbers
+    and how many digits each of them has; numbers with more than
+    ``MAX_DIGITS`` digits do not fit and must be re-read with ``cell_number``.
+    """
+    cells = np.ascontiguousarray(cells)
+    rows, width = cells.shape
+    digits = (cells >= ord('0')) & (cells <= ord('9'))
+    if not len(starts) or not rows:
+        return np.zeros((rows, len(starts)), dtype=np.int64), np.zeros((rows, len(starts)), dtype=np.int64)
+
+    # Place value of a digit: digits to its right, minus those past its group's end
+    right = np.zeros((rows, width + 1), dtype=np.int32)
+    right[:, :-1] = np.cumsum(digits[:, ::-1], axis=1, dtype=np.int32)[:, ::-1]
+    group = np.maximum(np.searchsorted(starts, np.arange(width), side='right') - 1, 0)
+    place = np.where(digits, right[:, :-1] - right[:, np.append(starts[1:], width)[group]] - 1, 0)
+    place = np.minimum(place, MAX_DIGITS - 1)
+
+    values = np.where(digits, (cells - np.uint8(ord('0'))).astype(np.int64) * POWERS[place], 0)
+    return np.add.reduceat(values, starts, axis=1), np.add.reduceat(digits, starts, axis=1, dtype=np.int64)
+
+
+def column_digits(grid):
+    """Read every column top to bottom as one number; returns numbers and digit counts.
+
+    Equivalent to ``digit_numbers(grid.T, [0])`` but accumulated down the
+    untransposed grid, which keeps NumPy working along its long rows.  The
+    same ``MAX_DIGITS`` caveat applies.
+    """
+    digits = (grid >= ord('0')) & (grid <= ord('9'))
+    below = np.cumsum(digits[::-1], axis=0, dtype=np.int32)[::-1] - digits
+    values = np.where(digits, (grid - np.uint8(ord('0'))).astype(np.int64) * POWERS[np.minimum(below, MAX_DIGITS - 1)], 0)
+    return values.sum(axis=0), digits.sum(axis=0, dtype=np.int64)
+
+
+def cell_number(cells):
+    """Big-int value of the digits in a 1-D run of cells, blanks skipped."""
+    digits = cells[(cells >= ord('0')) & (cells <= ord('9'))]
+    return int(digits.tobytes()) if len(digits) else 0
+
+
+def row_numbers(grid, problems):
+    """Part 1 view: the numbers of every row, one list per problem."""
+    starts = np.array([start for start, _, _ in problems], dtype=np.intp)
+    numbers, lengths = digit_numbers(grid, starts)
+    present = lengths > 0
+    long = np.argwhere(lengths > MAX_DIGITS).tolist()
+    if long:
+        # Too long for int64: read just those cells as Python ints
+        numbers = numbers.astype(object)
+        for row, k in long:
+            start, end, _ = problems[k]
+            numbers[row, k] = cell_number(grid[row, start:end])
+    if present.all():
+        return numbers.T.tolist()
+    return [[n for n, p in zip(column, flags) if p] for column, flags in zip(numbers.T.tolist(), present.T.tolist())]
+
+
+def column_numbers(grid, problems):
+    """Part 2 view: one number per column, read top to bottom, per problem.
+
+    Problems list their columns right to left.
+    """
+    numbers, lengths = column_digits(grid)
+    present = lengths > 0
+    long = np.flatnonzero(lengths > MAX_DIGITS).tolist()
+    if long:
+        # Too long for int64: read just those columns as Python ints
+        numbers = numbers.astype(object)
+        for col in long:
+            numbers[col] = cell_number(grid[:, col])
+    # Slicing one flat list is much cheaper than one small array per problem
+    flat = numbers[present].tolist()
+    bounds = np.cumsum(present)[np.array([end - 1 for _, end, _ in problems], dtype=np.intp)].tolist()
+    return [flat[begin:end][::-1] for begin, end in zip([0] + bounds, bounds)]
+
+
+def evaluate(values, problems):
+    """Total of every problem's operation over its values."""
+    return sum(OPERATIONS[symbol](numbers) for numbers, (_, _, symbol) in zip(values, problems))
+
+
+def fold(products, sums, digit_totals, multiply, values_of):
+    """Add up every problem's result, in int64 wherever that is provably exact.
+
+    A problem whose numbers have at most 18 digits between them stays below
+    10^18 whether multiplied or added, so the int64 reductions are exact
+    for it.  The rest, including any problem with a number too long for
+    int64 itself, are redone with big ints from ``values_of(k)``.
+    """
+    fits = digit_totals <= MAX_DIGITS
+    total = sum(np.where(multiply, products, sums)[fits].tolist())
+    for k in np.flatnonzero(~fits).tolist():
+        total += OPERATIONS['*' if multiply[k] else '+'](values_of(k))
+    return total
+
+
+def block_totals(grid, problems):
+    """Both answers for a run of problems, reduced with NumPy instead of per-problem lists."""
+    if not problems:
+        return 0, 0
+    starts = np.array([start for start, _, _ in problems], dtype=np.intp)
+    multiply = np.array([symbol == '*' for _, _, symbol in problems])
+
+    # Part 1: reduce each problem's rows; rows without digits are skipped
+    numbers, lengths = digit_numbers(grid, starts)
+    present = lengths > 0
+    total1 = fold(np.where(present, numbers, 1).prod(axis=0), numbers.sum(axis=0), lengths.sum(axis=0), multiply,
+                  lambda k: [cell_number(grid[row, problems[k][0]:problems[k][1]])
+                             for row in np.flatnonzero(present[:, k]).tolist()])
+
+    # Part 2: reduce each problem's columns; blank separators are neutral for + and *
+    numbers, lengths = column_digits(grid)
+    present = lengths > 0
+    total2 = fold(np.multiply.reduceat(np.where(present, numbers, 1), starts), np.add.reduceat(numbers, starts),
+                  np.add.reduceat(lengths, starts), multiply,
+                  lambda k: [cell_number(grid[:, col]) for col in range(problems[k][0], problems[k][1]) if present[col]])
+    return total1, total2
+
+
+def solve_parallel(filename="input.txt", workers=None):
+    """Answer both parts with column blocks of problems evaluated on a process pool."""
+    grid, problems, path, regular = load_worksheet(filename)
+    if not regular:
+        return part1(path), part2(path)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or grid.nbytes < MIN_PARALLEL_BYTES:
+        return block_totals(grid, problems)
+
+    # Cut at problem boundaries, so every block starts and ends at a blank column
+    size = -(-len(problems) // (workers * 4))
+    blocks = []
+    for i in range(0, len(problems), size):
+        chunk = problems[i:i + size]
+        left, right = chunk[0][0], chunk[-1][1]
+        blocks.append((np.ascontiguousarray(grid[:, left:right]),
+                       [(start - left, end - left, symbol) for start, end, symbol in chunk]))
+
+    results = map_calls(6, 'block_totals', blocks, workers)
+    return sum(r[0] for r in results), sum(r[1] for r in results)
+
+
+def worksheet_part1(sheet):
+    """Part 1 from a loaded worksheet."""
+    if not sheet.regular:
+        return part1(sheet.path)
+    return evaluate(row_numbers(sheet.grid, sheet.problems), sheet.problems)
+
+
+def worksheet_part2(sheet):
+    """Part 2 from a loaded worksheet."""
+    if not sheet.regular:
+        return part2(sheet.path)
+    return evaluate(column_numbers(sheet.grid, sheet.problems), sheet.problems)
+
+
+def solve(filename="input.txt"):
+    """Answer both parts from a single load of the worksheet."""
+    sheet = load_worksheet(filename)
+    return worksheet_part1(sheet), worksheet_part2(sheet)
+
+
+def part1(filename="input.txt"):
     """Part 1: Column operations on number matrix."""
-    matrix, symbols = load_input_data(parse_as_numbers=True)
+    matrix, symbols = load_input_data(parse_as_numbers=True, filename=filename)
     return sum(apply_operations(matrix, symbols, axis='column'))
 
 
-def part2():
+def part2(filename="input.txt"):
     """Part 2: Row operations on transposed character matrix."""
-    raw_lines, symbols, spacing = load_input_data(parse_as_numbers=False)
+    raw_lines, symbols, spacing = load_input_data(parse_as_numbers=False, filename=filename)
     return sum(apply_operations(transpose_and_segment(raw_lines, spacing), symbols, axis='row'))
 
 
@@ -105,11 +340,13 @@ def main():
     print("Advent of Code 2025 - Day 06")
     print("=" * 30)
 
+    result1, result2 = solve()
+
     print("Part 1:")
-    print(f"Result: {part1()}")
+    print(f"Result: {result1}")
 
     print(f"\nPart 2:")
-    print(f"Result: {part2()}")
+    print(f"Result: {result2}")
 
 
 if __name__ == "__main__":
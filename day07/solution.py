@@ -1,7 +1,21 @@
 #!/usr/bin/env python3
 """Advent of Code 2025 - Day 07"""
 
+import heapq
 import os
+import re
+import sys
+from bisect import bisect_right
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.inputs import iter_byte_lines, map_input  # noqa: E402
+
+BEAM_OR_SPLITTER = re.compile(rb'[S^]')
+# A row at most doubles the timeline total, so below this it still fits int64
+INT64_SAFE_TOTAL = np.iinfo(np.int64).max // 2
 
 
 def load_data(filename="input.txt"):
@@ -9,17 +23,39 @@ def load_data(filename="input.txt"):
     filepath = os.path.join(os.path.dirname(__file__), filename)
     if not os.path.exists(filepath):
         filepath = os.path.join(os.path.dirname(__file__), "example.txt")
-    with open(filepath, 'r') as f:
-        return [[i for i, c in enumerate(line) if c in 'S^']
-                for line in f.read().strip().split('\n')]
+    return [[match.start() for match in BEAM_OR_SPLITTER.finditer(line)]
+            for line in iter_byte_lines(map_input(filepath), strip=False)]
+
+
+def stream_rows(source="-"):
+    """Yield the S/^ indexes of each line from a path, '-' (stdin) or a binary stream.
+
+    Only one line is held at a time, so ``solve`` over this generator keeps
+    memory at the size of the beam frontier.
+    """
+    if source == "-":
+        yield from _row_indexes(sys.stdin.buffer)
+    elif isinstance(source, str):
+        with open(source, 'rb') as f:
+            yield from _row_indexes(f)
+    else:
+        yield from _row_indexes(source)
+
+
+def _row_indexes(lines):
+    for line in lines:
+        line = line.rstrip(b'\r\n')
+        if line:
+            yield [match.start() for match in BEAM_OR_SPLITTER.finditer(line)]
 
 
 def solve(data):
-    """Solve both parts in single traversal."""
-    tachyon = {idx: 1 for idx in data[0]}
+    """Solve both parts in single traversal; ``data`` may be any iterable of rows."""
+    rows = iter(data)
+    tachyon = {idx: 1 for idx in next(rows, [])}
     splits = 0
 
-    for row_indexes in data[1:]:
+    for row_indexes in rows:
         row_set = set(row_indexes)
         new_tachyon = {}
         for idx, count in tachyon.items():
@@ -34,7 +70,96 @@ def solve(data):
     return splits, sum(tachyon.values())
 
 
+def solve_numpy(data):
+    """Solve both parts with beam counts held in one width-sized vector.
+
+    Each row is a splitter mask, and a step is mask, shift left, shift
+    right, add.  Counts stay int64 while the (exactly tracked) timeline
+    total provably fits and move to Python ints after that.
+    """
+    width = max((max(row) for row in data if row), default=0) + 1
+    # One spare column on each side catches beams split off the edges
+    tachyon = np.zeros(width + 2, dtype=np.int64)
+    for idx in data[0]:
+        tachyon[idx + 1] += 1
+    total = int(tachyon.sum())
+    splitters = np.zeros(width + 2, dtype=bool)
+    splits = 0
+
+    for row_indexes in data[1:]:
+        if not row_indexes:
+            continue
+        if tachyon.dtype != object and total > INT64_SAFE_TOTAL:
+            tachyon = tachyon.astype(object)
+        splitters[:] = False
+        splitters[np.array(row_indexes) + 1] = True
+
+        split = np.where(splitters, tachyon, 0)
+        splits += int(np.count_nonzero(split))
+        total += int(split.sum())
+        tachyon = tachyon - split
+        tachyon[:-1] += split[1:]
+        tachyon[1:] += split[:-1]
+
+    return splits, total
+
+
+def index_columns(data):
+    """Split rows into the starting beams and, per column, the sorted rows holding a splitter."""
+    rows = iter(data)
+    beams = next(rows, [])
+    columns = {}
+    for row, row_indexes in enumerate(rows, 1):
+        for idx in row_indexes:
+            columns.setdefault(idx, []).append(row)
+    return beams, columns
+
+
+def solve_sparse(beams, columns):
+    """Solve both parts by jumping beams from splitter to splitter.
+
+    A beam falls straight down its column, so ``bisect`` finds the next
+    splitter it hits.  Timelines reaching the same splitter are merged in
+    ``arriving`` and splitters are handled in row order from a heap, so the
+    work grows with the splitters actually hit rather than rows x beams.
+    """
+    arriving = {}
+    queue = []
+    exited = 0
+
+    def fall(row, col, count):
+        nonlocal exited
+        below = columns.get(col, ())
+        i = bisect_right(below, row)
+        if i == len(below):
+            exited += count
+            return
+        hit = (below[i], col)
+        if hit in arriving:
+            arriving[hit] += count
+        else:
+            arriving[hit] = count
+            heapq.heappush(queue, hit)
+
+    for col in dict.fromkeys(beams):
+        fall(0, col, 1)
+
+    splits = 0
+    while queue:
+        row, col = heapq.heappop(queue)
+        count = arriving.pop((row, col))
+        splits += 1
+        fall(row, col - 1, count)
+        fall(row, col + 1, count)
+
+    return splits, exited
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Stream rows from a path or '-' (stdin) instead of loading the file
+        print(*solve(stream_rows(sys.argv[1])))
+        sys.exit()
     print("Advent of Code 2025 - Day 07\n" + "=" * 30)
     part1, part2 = solve(load_data())
     print(f"Part 1: {part1}\nPart 2: {part2}")
@@ -4,8 +4,13 @@
 import os
 import math
 import heapq
+import sys
 from itertools import product
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.inputs import iter_ints, map_input  # noqa: E402
+
 
 def euclidean_distance(p1, p2):
     """Calculate 3D Euclidean distance between two points."""
@@ -40,14 +45,9 @@ def load_data(filename="input.txt"):
     if not os.path.exists(filepath):
         filepath = os.path.join(os.path.dirname(__file__), "example.txt")
 
-    with open(filepath, 'r') as f:
-        lines = f.read().strip().split('\n')
-
     # Parse each line into a tuple of 3 integers
-    data = []
-    for line in lines:
-        numbers = tuple(int(x) for x in line.split(','))
-        data.append(numbers)
+    numbers = iter_ints(map_input(filepath), signed=True)
+    data = list(zip(numbers, numbers, numbers))
 
     # Add a list of X -1s to each tuple, where X is the number of tuples
     X = len(data)
@@ -174,9 +174,10 @@ def solve_part1(circuit_data):
     return result
 
 
-def solve_part2(circuit_data):
+def solve_part2(circuit_data, verbose=False):
     """Solve part 2 of the puzzle - hierarchical clustering with merging."""
-    print(f"Part 2: Starting hierarchical clustering with {len(circuit_data)} points")
+    if verbose:
+        print(f"Part 2: Starting hierarchical clustering with {len(circuit_data)} points")
 
     # Continue merging until only 2 groups remain
     iteration = 0
@@ -267,7 +268,8 @@ def solve_part2(circuit_data):
             else:
                 circuit[2] = (min_dist_value, min_dist_index, -1, -1)
 
-        print(f"Iteration {iteration}: {len(circuit_data)} groups remaining")
+        if verbose:
+            print(f"Iteration {iteration}: {len(circuit_data)} groups remaining")
 
     # Calculate result by multiplying X coordinates of smallest distance nodes from final 2 groups
     if len(circuit_data) == 2:
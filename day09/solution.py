@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.inputs import iter_ints, map_input  # noqa: E402
 
 
 def lines_intersect(rect_edge, poly_edge):
@@ -98,16 +103,8 @@ def load_data(filename="input.txt"):
     if not os.path.exists(filepath):
         filepath = os.path.join(os.path.dirname(__file__), "example.txt")
 
-    with open(filepath, 'r') as f:
-        lines = f.read().strip().split('\n')
-
-    coordinates = []
-    for line in lines:
-        if line.strip():
-            x, y = map(int, line.split(','))
-            coordinates.append((x, y))
-
-    return coordinates
+    numbers = iter_ints(map_input(filepath), signed=True)
+    return list(zip(numbers, numbers))
 
 
 def solve_part1(data):
@@ -126,22 +123,39 @@ def solve_part1(data):
     return max_area
 
 
+def rectangles_by_area(nodes):
+    rectangles = generate_rectangles(sorted(nodes))
+    rectangles.sort(key=lambda x: x[0], reverse=True)
+    return rectangles
+
+
+def largest_enclosed_area(rectangles, polygon_data):
+    """Area of the first rectangle, largest first, that stays inside the polygon."""
+    return next((area for area, corners in rectangles
+                 if not check_rectangle_intersections(corners, polygon_data)), 0)
+
+
 def solve_part2(data):
     if not data:
         return 0
 
-    rectangles = generate_rectangles(sorted(data))
-    rectangles.sort(key=lambda x: x[0], reverse=True)
+    return largest_enclosed_area(rectangles_by_area(data), data)
 
-    return next((area for area, corners in rectangles
-                 if not check_rectangle_intersections(corners, data)), 0)
+
+def solve(data):
+    """Solve both parts from a single enumeration of point pairs."""
+    if not data:
+        return 0, 0
+
+    rectangles = rectangles_by_area(data)
+    part1 = rectangles[0][0] if rectangles else 0
+    return part1, largest_enclosed_area(rectangles, data)
 
 
 if __name__ == "__main__":
     data = load_data()
 
-    part1_result = solve_part1(data)
-    part2_result = solve_part2(data)
+    part1_result, part2_result = solve(data)
 
     print(f"Part 1: {part1_result}")
     print(f"Part 2: {part2_result}")
\ No newline at end of file